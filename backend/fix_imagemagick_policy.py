@@ -5,9 +5,24 @@ This script fixes the ImageMagick policy that blocks MoviePy from creating text
 """
 
 import os
+import re
 import subprocess
 import sys
 
+# Matches the restrictive entries MoviePy trips over: the @* path pattern
+# (temp file access, sometimes written escaped as @\*) and the LABEL, TEXT
+# and PNG coders used for text rendering and image output.
+POLICY_PATTERN = re.compile(
+    r'<policy domain="(path|coder)" rights="none" pattern="(@\\?\*|LABEL|TEXT|PNG)"'
+)
+
+def _allow_policy(match):
+    """Rewrite a matched policy entry to rights="read|write"."""
+    domain, pattern = match.groups()
+    if pattern.startswith("@"):
+        pattern = "@*"
+    return f'<policy domain="{domain}" rights="read|write" pattern="{pattern}"'
+
 def fix_imagemagick_policy():
     """Fix ImageMagick security policy to allow MoviePy operations."""
     
@@ -20,56 +35,37 @@ def fix_imagemagick_policy():
     fixed = False
     
     for policy_file in policy_paths:
-        if not os.path.exists(policy_file):
+        # Read first (a missing file is simply skipped); write access is only
+        # needed when the policy actually has to change
+        try:
+            with open(policy_file, 'r') as f:
+                content = f.read()
+        except FileNotFoundError:
             continue
+        except PermissionError:
+            print(f"❌ Permission denied. Run with sudo:")
+            print(f"   sudo python3 {__file__}")
+            return False
             
         print(f"📝 Found ImageMagick policy: {policy_file}")
         
+        # Check if already fixed
+        if 'rights="read|write" pattern="@*"' in content:
+            print(f"✅ Policy already fixed: {policy_file}")
+            fixed = True
+            continue
+        
         try:
-            # Backup original
-            backup_file = f"{policy_file}.backup"
-            if not os.path.exists(backup_file):
-                subprocess.run(f"cp {policy_file} {backup_file}", shell=True, check=True)
-                print(f"✅ Backed up to: {backup_file}")
-            
-            # Read current policy
-            with open(policy_file, 'r') as f:
-                content = f.read()
-            
-            # Check if already fixed
-            if 'rights="read|write" pattern="@*"' in content:
-                print(f"✅ Policy already fixed: {policy_file}")
-                fixed = True
-                continue
-            
-            # Apply fixes
-            original_content = content
-            
-            # Fix @* pattern (the main issue)
-            content = content.replace(
-                'rights="none" pattern="@*"',
-                'rights="read|write" pattern="@*"'
-            )
-            content = content.replace(
-                '<policy domain="path" rights="none" pattern="@\\*"',
-                '<policy domain="path" rights="read|write" pattern="@*"'
-            )
+            # Apply all fixes (@* path, LABEL/TEXT/PNG coders) in one pass
+            content, replacements = POLICY_PATTERN.subn(_allow_policy, content)
             
-            # Also fix LABEL, TEXT, and other coders that MoviePy uses
-            content = content.replace(
-                '<policy domain="coder" rights="none" pattern="LABEL"',
-                '<policy domain="coder" rights="read|write" pattern="LABEL"'
-            )
-            content = content.replace(
-                '<policy domain="coder" rights="none" pattern="TEXT"',
-                '<policy domain="coder" rights="read|write" pattern="TEXT"'
-            )
-            content = content.replace(
-                '<policy domain="coder" rights="none" pattern="PNG"',
-                '<policy domain="coder" rights="read|write" pattern="PNG"'
-            )
-            
-            if content != original_content:
+            if replacements:
+                # Backup original
+                backup_file = f"{policy_file}.backup"
+                if not os.path.exists(backup_file):
+                    subprocess.run(["cp", policy_file, backup_file], check=True)
+                    print(f"✅ Backed up to: {backup_file}")
+                
                 # Write back
                 with open(policy_file, 'w') as f:
                     f.write(content)
@@ -93,13 +89,12 @@ def fix_imagemagick_policy():
             try:
                 print("🔧 Trying sed fallback...")
                 subprocess.run(
-                    f'sed -i \'s/rights="none" pattern="@\\*"/rights="read|write" pattern="@*"/g\' {policy_file}',
-                    shell=True,
-                    check=True
-                )
-                subprocess.run(
-                    f'sed -i \'s/<policy domain="coder" rights="none" pattern="LABEL"/<policy domain="coder" rights="read|write" pattern="LABEL"/g\' {policy_file}',
-                    shell=True,
+                    [
+                        "sed", "-i",
+                        "-e", 's/rights="none" pattern="@\\*"/rights="read|write" pattern="@*"/g',
+                        "-e", 's/<policy domain="coder" rights="none" pattern="LABEL"/<policy domain="coder" rights="read|write" pattern="LABEL"/g',
+                        policy_file
+                    ],
                     check=True
                 )
                 print(f"✅ Fixed using sed: {policy_file}")
@@ -134,7 +129,7 @@ def main():
     
     # Check if ImageMagick is installed
     try:
-        result = subprocess.run("convert -version", shell=True, capture_output=True, text=True)
+        result = subprocess.run(["convert", "-version"], capture_output=True, text=True)
         if result.returncode == 0:
             version_line = result.stdout.split('\n')[0]
             print(f"✅ ImageMagick found: {version_line}")
@@ -142,6 +137,10 @@ def main():
             print("❌ ImageMagick not found. Please install it first:")
             print("   apt-get install -y imagemagick")
             return
+    except FileNotFoundError:
+        print("❌ ImageMagick not found. Please install it first:")
+        print("   apt-get install -y imagemagick")
+        return
     except Exception as e:
         print(f"❌ Could not check ImageMagick: {e}")
         return
@@ -3,21 +3,33 @@
 echo "🚀 Installing ImageMagick for Google Colab"
 echo "=========================================="
 
-# Update package lists
-echo "📦 Updating package lists..."
-apt-get update -y
+APT_PACKAGES=(
+    imagemagick
+    imagemagick-dev
+    libfontconfig1-dev
+    libfreetype6-dev
+    fonts-dejavu-core
+    fonts-liberation
+    ttf-mscorefonts-installer
+)
 
-# Install ImageMagick and dependencies
-echo "🎨 Installing ImageMagick..."
-apt-get install -y imagemagick imagemagick-dev
-
-# Install additional dependencies for better font support
-echo "🔤 Installing font libraries..."
-apt-get install -y libfontconfig1-dev libfreetype6-dev
+# Skip the apt phase entirely when every package is already installed (re-run cell)
+if dpkg -s "${APT_PACKAGES[@]}" &> /dev/null; then
+    echo "✅ ImageMagick, font libraries and fonts already installed, skipping apt"
+else
+    # Update package lists
+    echo "📦 Updating package lists..."
+    apt-get update -y
 
-# Install common fonts
-echo "📝 Installing common fonts..."
-apt-get install -y fonts-dejavu-core fonts-liberation ttf-mscorefonts-installer
+    # Install ImageMagick, font libraries and common fonts in a single apt transaction
+    echo "🎨 Installing ImageMagick, font libraries and fonts..."
+    # Use apt-fast (parallel aria2 downloads) when the runtime already provides it
+    if command -v apt-fast &> /dev/null; then
+        apt-fast install -y "${APT_PACKAGES[@]}"
+    else
+        apt-get install -y "${APT_PACKAGES[@]}"
+    fi
+fi
 
 # Configure ImageMagick policy for MoviePy compatibility
 echo "⚙️  Configuring ImageMagick policy..."
@@ -27,10 +39,12 @@ if [ -f "$POLICY_FILE" ]; then
     # Backup original policy
     cp "$POLICY_FILE" "${POLICY_FILE}.backup"
     
-    # Remove restrictive policies that interfere with MoviePy
-    sed -i 's/<policy domain="path" rights="none" pattern="@\*"/<policy domain="path" rights="read|write" pattern="@*"/g' "$POLICY_FILE"
-    sed -i 's/<policy domain="coder" rights="none" pattern="PDF"/<policy domain="coder" rights="read|write" pattern="PDF"/g' "$POLICY_FILE"
-    sed -i 's/<policy domain="coder" rights="none" pattern="LABEL"/<policy domain="coder" rights="read|write" pattern="LABEL"/g' "$POLICY_FILE"
+    # Remove restrictive policies that interfere with MoviePy (single sed pass)
+    sed -i \
+        -e 's/<policy domain="path" rights="none" pattern="@\*"/<policy domain="path" rights="read|write" pattern="@*"/g' \
+        -e 's/<policy domain="coder" rights="none" pattern="PDF"/<policy domain="coder" rights="read|write" pattern="PDF"/g' \
+        -e 's/<policy domain="coder" rights="none" pattern="LABEL"/<policy domain="coder" rights="read|write" pattern="LABEL"/g' \
+        "$POLICY_FILE"
     
     echo "✅ ImageMagick policy updated for MoviePy compatibility"
 else
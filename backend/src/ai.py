@@ -2,28 +2,84 @@
 Optimized AI functions for transcript analysis using Ollama.
 Streamlined for Google Colab integration with minimal dependencies.
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
+from logging.handlers import QueueHandler, QueueListener
+import asyncio
+import atexit
+import bisect
+import heapq
 import logging
 import os
+import queue
 import json
 import time
 import requests
+from requests.adapters import HTTPAdapter
 import re
+import threading
 from datetime import datetime
 
+from .prompt_cache import get_cached_response, store_response
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:  # orjson is optional; fall back to the stdlib parser/encoder
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 logger = logging.getLogger(__name__)
 
 # --- Ollama File Logging Setup ---------------------------------------------------
 # Write logs inside the project tree by default
 OLLAMA_LOG_DIR = "backend/logs"
 OLLAMA_LOG_FILE = os.path.join(OLLAMA_LOG_DIR, "ollama_log")
+# Set to DEBUG to also dump full prompts and raw request/response payloads
+OLLAMA_LOG_LEVEL = getattr(logging, os.getenv("OLLAMA_LOG_LEVEL", "INFO").upper(), logging.INFO)
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that keeps records in its write buffer until a checkpoint.
+    
+    StreamHandler flushes after every record (one write() per log line); here
+    the buffer is written out on ERROR records, on _flush_log_file()
+    checkpoints (which also fsync), when it fills up, and when the handler is
+    closed. The file itself stays open for the life of the process.
+    """
+    buffer_size = 128 * 1024
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record):
+        try:
+            if getattr(record, "log_checkpoint", False):
+                # Checkpoints also fsync, so durability is paid once per analysis
+                self.flush()
+                if self.stream is not None:
+                    os.fsync(self.stream.fileno())
+                return
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
 
 # Initialize file logger for Ollama operations
 _ollama_file_logger = None
+_ollama_log_listener = None
 
 def _get_ollama_file_logger():
     """Get or create the file logger for Ollama operations."""
-    global _ollama_file_logger
+    global _ollama_file_logger, _ollama_log_listener
     
     if _ollama_file_logger is not None:
         return _ollama_file_logger
@@ -34,14 +90,14 @@ def _get_ollama_file_logger():
         
         # Create file logger
         _ollama_file_logger = logging.getLogger("ollama_file_logger")
-        _ollama_file_logger.setLevel(logging.DEBUG)
+        _ollama_file_logger.setLevel(OLLAMA_LOG_LEVEL)
         
         # Remove existing handlers to avoid duplicates
         _ollama_file_logger.handlers.clear()
         
-        # Create file handler
-        file_handler = logging.FileHandler(OLLAMA_LOG_FILE, mode='a', encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
+        # Create file handler (level filtering happens on the logger, so
+        # checkpoint records always reach the handler)
+        file_handler = _BufferedFileHandler(OLLAMA_LOG_FILE, mode='a', encoding='utf-8')
         
         # Create formatter
         formatter = logging.Formatter(
@@ -50,9 +106,22 @@ def _get_ollama_file_logger():
         )
         file_handler.setFormatter(formatter)
         
-        _ollama_file_logger.addHandler(file_handler)
+        # Hand records to a background thread so callers never block on file I/O;
+        # the listener drains the queue and is flushed/stopped at interpreter exit
+        log_queue = queue.SimpleQueue()
+        _ollama_log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _ollama_log_listener.start()
+        atexit.register(_ollama_log_listener.stop)
+        
+        _ollama_file_logger.addHandler(QueueHandler(log_queue))
         _ollama_file_logger.propagate = False
         
+        # Mirror this module's logger into the same file so status lines are
+        # logged once with logger.* rather than repeated through _log_to_file
+        module_handler = QueueHandler(log_queue)
+        module_handler.setLevel(OLLAMA_LOG_LEVEL)
+        logger.addHandler(module_handler)
+        
         _ollama_file_logger.info("=" * 80)
         _ollama_file_logger.info("OLLAMA LOGGING INITIALIZED")
         _ollama_file_logger.info(f"Log file: {OLLAMA_LOG_FILE}")
@@ -60,11 +129,11 @@ def _get_ollama_file_logger():
         
         return _ollama_file_logger
     except Exception as e:
-        logger.error(f"Failed to initialize Ollama file logger: {e}")
+        logger.error("Failed to initialize Ollama file logger: %s", e)
         return None
 
 def _log_to_file(message: str, level: str = "INFO"):
-    """Log message to Ollama log file and flush immediately."""
+    """Log message to Ollama log file (written asynchronously by the queue listener)."""
     file_logger = _get_ollama_file_logger()
     if file_logger:
         try:
@@ -76,21 +145,40 @@ def _log_to_file(message: str, level: str = "INFO"):
                 file_logger.error(message)
             else:
                 file_logger.info(message)
-            # Force flush all handlers to ensure logs are written immediately
-            for handler in file_logger.handlers:
-                handler.flush()
         except Exception as e:
             # Don't fail if logging fails
-            logger.error(f"Failed to write to log file: {e}")
+            logger.error("Failed to write to log file: %s", e)
+
+def _flush_log_file():
+    """Write buffered log lines to the Ollama log file (once per analysis)."""
+    if _ollama_file_logger is None:
+        return
+    # Routed through the queue so it lands after every record logged so far
+    checkpoint = logging.makeLogRecord({
+        "name": _ollama_file_logger.name,
+        "levelno": logging.INFO,
+        "levelname": "INFO",
+        "msg": "",
+        "log_checkpoint": True
+    })
+    _ollama_file_logger.handle(checkpoint)
+
+def _log_file_debug_enabled() -> bool:
+    """Check whether the Ollama log file records DEBUG payload dumps (skip building them otherwise)."""
+    file_logger = _get_ollama_file_logger()
+    return file_logger is not None and file_logger.isEnabledFor(logging.DEBUG)
 
 # --- Domain models ----------------------------------------------------------------
+@dataclass(slots=True, frozen=True)
 class TranscriptSegment:
-    def __init__(self, start_time: str, end_time: str, text: str, relevance_score: float, reasoning: str):
-        self.start_time = start_time
-        self.end_time = end_time
-        self.text = text
-        self.relevance_score = relevance_score
-        self.reasoning = reasoning
+    start_time: str
+    end_time: str
+    text: str
+    relevance_score: float
+    reasoning: str
+    # Parsed start/end seconds, kept from validation for cheap comparisons
+    start_sec: int = field(repr=False)
+    end_sec: int = field(repr=False)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -101,11 +189,11 @@ class TranscriptSegment:
             "reasoning": self.reasoning
         }
 
+@dataclass(slots=True)
 class TranscriptAnalysis:
-    def __init__(self, most_relevant_segments: List[TranscriptSegment], summary: str, key_topics: List[str]):
-        self.most_relevant_segments = most_relevant_segments
-        self.summary = summary
-        self.key_topics = key_topics
+    most_relevant_segments: List[TranscriptSegment]
+    summary: str
+    key_topics: List[str]
 
 # --- System prompt for Ollama ---------------------------------------------------
  
@@ -157,11 +245,45 @@ TRANSCRIPT:
 OUTPUT ONLY VALID JSON!
 """
 
+# Collapse runs of spaces/tabs in the template so every request carries fewer
+# prompt bytes and tokens; line breaks are kept for readability to the model
+OLLAMA_SYSTEM_PROMPT = re.sub(r"[ \t]+", " ", OLLAMA_SYSTEM_PROMPT).strip()
+
 # --- Ollama Configuration --------------------------------------------------------
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.1:8b-instruct-q6_K")
 OLLAMA_TIMEOUT = int(os.getenv("OLLAMA_TIMEOUT", "7200"))  # 2 hours default for long transcripts (Ollama can be slow)
 OLLAMA_TEST_TIMEOUT = int(os.getenv("OLLAMA_TEST_TIMEOUT", "300"))  # 5 minutes for test requests
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")  # Keep the model resident between calls
+OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))  # Should match the server's OLLAMA_NUM_PARALLEL
+
+# Shared HTTP session so the connection test and analysis calls reuse one
+# keep-alive connection instead of paying a new TCP handshake per request
+_ollama_session = None
+_ollama_session_lock = threading.Lock()
+
+def _get_ollama_session() -> requests.Session:
+    """Get or create the shared requests session for Ollama calls."""
+    global _ollama_session
+    
+    if _ollama_session is not None:
+        return _ollama_session
+    
+    with _ollama_session_lock:
+        if _ollama_session is None:
+            session = requests.Session()
+            # Size the pool for OLLAMA_NUM_PARALLEL concurrent requests so
+            # connections aren't discarded; retries are handled by call_ollama itself
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=max(10, OLLAMA_NUM_PARALLEL),
+                max_retries=0
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate"})
+            _ollama_session = session
+        return _ollama_session
 
 def test_ollama_connection() -> bool:
     """Test Ollama connection with a simple 'Hi' request to verify it's working."""
@@ -169,91 +291,76 @@ def test_ollama_connection() -> bool:
     _log_to_file("STEP: Testing Ollama Connection")
     _log_to_file("=" * 80)
     try:
-        logger.info(f"🔍 Testing Ollama connection at {OLLAMA_BASE_URL}...")
-        _log_to_file(f"🔍 Testing Ollama connection at {OLLAMA_BASE_URL}...")
-        logger.info(f"⏰ Test timeout set to {OLLAMA_TEST_TIMEOUT} seconds ({OLLAMA_TEST_TIMEOUT//60} minutes)")
-        _log_to_file(f"⏰ Test timeout set to {OLLAMA_TEST_TIMEOUT} seconds ({OLLAMA_TEST_TIMEOUT//60} minutes)")
+        logger.info("🔍 Testing Ollama connection at %s...", OLLAMA_BASE_URL)
+        logger.info("⏰ Test timeout set to %s seconds (%s minutes)", OLLAMA_TEST_TIMEOUT, OLLAMA_TEST_TIMEOUT//60)
         
         # First, test if Ollama is reachable via tags endpoint
         tags_url = f"{OLLAMA_BASE_URL}/api/tags"
-        logger.info(f"📡 Checking Ollama availability: {tags_url}")
-        _log_to_file(f"📡 Checking Ollama availability: {tags_url}")
+        logger.info("📡 Checking Ollama availability: %s", tags_url)
         
         try:
-            import time as time_module
-            tags_start = time_module.time()
-            tags_response = requests.get(tags_url, timeout=min(OLLAMA_TEST_TIMEOUT, 60))  # Max 60s for tags
-            tags_time = time_module.time() - tags_start
+            tags_start = time.time()
+            tags_response = _get_ollama_session().get(tags_url, timeout=min(OLLAMA_TEST_TIMEOUT, 60))  # Max 60s for tags
+            tags_time = time.time() - tags_start
             tags_response.raise_for_status()
             tags_data = tags_response.json()
             models = tags_data.get('models', [])
             model_names = [m.get('name', '') for m in models]
-            logger.info(f"✅ Ollama is reachable! Found {len(models)} model(s): {model_names} (took {tags_time:.2f}s)")
-            _log_to_file(f"✅ Ollama is reachable! Found {len(models)} model(s): {model_names} (took {tags_time:.2f}s)")
+            logger.info("✅ Ollama is reachable! Found %s model(s): %s (took %.2fs)", len(models), model_names, tags_time)
         except Exception as e:
-            logger.error(f"❌ Ollama tags endpoint failed: {e}")
-            _log_to_file(f"❌ Ollama tags endpoint failed: {e}", "ERROR")
+            logger.error("❌ Ollama tags endpoint failed: %s", e)
             return False
         
         # Now test with a simple generate request
-        logger.info(f"🧪 Sending test 'Hi' request to Ollama with model {OLLAMA_MODEL}...")
-        _log_to_file(f"🧪 Sending test 'Hi' request to Ollama with model {OLLAMA_MODEL}...")
-        logger.info(f"⏰ This test may take up to {OLLAMA_TEST_TIMEOUT//60} minutes. Please wait...")
-        _log_to_file(f"⏰ This test may take up to {OLLAMA_TEST_TIMEOUT//60} minutes. Please wait...")
+        logger.info("🧪 Sending test 'Hi' request to Ollama with model %s...", OLLAMA_MODEL)
+        logger.info("⏰ This test may take up to %s minutes. Please wait...", OLLAMA_TEST_TIMEOUT//60)
         test_url = f"{OLLAMA_BASE_URL}/api/generate"
         test_payload = {
             "model": OLLAMA_MODEL,
             "prompt": "Say 'Hi' in one word. Only respond with that word.",
             "stream": False,
+            "keep_alive": OLLAMA_KEEP_ALIVE,
             "options": {
                 "temperature": 0.1,
-                "max_tokens": 5
+                # Ollama's output cap; a one-word reply is all the test needs
+                "num_predict": 5
             }
         }
         
-        logger.info(f"📤 Test request URL: {test_url}")
-        _log_to_file(f"📤 Test request URL: {test_url}")
-        logger.info(f"📤 Test request payload: model={OLLAMA_MODEL}, prompt_length={len(test_payload['prompt'])}")
-        _log_to_file(f"📤 Test request payload: model={OLLAMA_MODEL}, prompt_length={len(test_payload['prompt'])}")
+        logger.info("📤 Test request URL: %s", test_url)
+        logger.info("📤 Test request payload: model=%s, prompt_length=%s", OLLAMA_MODEL, len(test_payload['prompt']))
         _log_to_file(f"📤 Test prompt: {test_payload['prompt']}")
-        _log_to_file(f"📤 Full test payload: {json.dumps(test_payload, indent=2)}")
+        if _log_file_debug_enabled():
+            _log_to_file(f"📤 Full test payload: {_json_dumps(test_payload)}", "DEBUG")
         
-        import time as time_module
-        test_start = time_module.time()
-        test_response = requests.post(test_url, json=test_payload, timeout=OLLAMA_TEST_TIMEOUT)
-        test_time = time_module.time() - test_start
+        test_start = time.time()
+        test_response = _get_ollama_session().post(test_url, json=test_payload, timeout=OLLAMA_TEST_TIMEOUT)
+        test_time = time.time() - test_start
         test_response.raise_for_status()
         
         test_result = test_response.json()
         test_output = test_result.get("response", "").strip()
         
-        logger.info(f"✅ Ollama test response received: '{test_output}' (took {test_time:.2f}s)")
-        _log_to_file(f"✅ Ollama test response received: '{test_output}' (took {test_time:.2f}s)")
-        _log_to_file(f"📥 Full test response: {json.dumps(test_result, indent=2)}")
+        logger.info("✅ Ollama test response received: '%s' (took %.2fs)", test_output, test_time)
+        if _log_file_debug_enabled():
+            _log_to_file(f"📥 Full test response: {_json_dumps(test_result)}", "DEBUG")
         if test_time > 60:
-            logger.warning(f"⚠️ Ollama is slow (took {test_time:.2f}s for simple test), actual analysis may take 20-30 minutes")
-            _log_to_file(f"⚠️ Ollama is slow (took {test_time:.2f}s for simple test), actual analysis may take 20-30 minutes", "WARNING")
-        logger.info(f"✅ Ollama connection test successful! Model {OLLAMA_MODEL} is ready for analysis.")
-        _log_to_file(f"✅ Ollama connection test successful! Model {OLLAMA_MODEL} is ready for analysis.")
+            logger.warning("⚠️ Ollama is slow (took %.2fs for simple test), actual analysis may take 20-30 minutes", test_time)
+        logger.info("✅ Ollama connection test successful! Model %s is ready for analysis.", OLLAMA_MODEL)
         _log_to_file("=" * 80)
         
         return True
         
     except requests.exceptions.Timeout as e:
-        logger.error(f"❌ Ollama connection test timed out after {OLLAMA_TEST_TIMEOUT}s: {e}")
-        _log_to_file(f"❌ Ollama connection test timed out after {OLLAMA_TEST_TIMEOUT}s: {e}", "ERROR")
-        logger.error(f"   This suggests Ollama may be overloaded or not responding properly.")
-        _log_to_file(f"   This suggests Ollama may be overloaded or not responding properly.", "ERROR")
+        logger.error("❌ Ollama connection test timed out after %ss: %s", OLLAMA_TEST_TIMEOUT, e)
+        logger.error("   This suggests Ollama may be overloaded or not responding properly.")
         return False
     except requests.exceptions.ConnectionError as e:
-        logger.error(f"❌ Ollama connection test failed - cannot connect to {OLLAMA_BASE_URL}: {e}")
-        _log_to_file(f"❌ Ollama connection test failed - cannot connect to {OLLAMA_BASE_URL}: {e}", "ERROR")
-        logger.error(f"   Please ensure Ollama is running and accessible.")
-        _log_to_file(f"   Please ensure Ollama is running and accessible.", "ERROR")
+        logger.error("❌ Ollama connection test failed - cannot connect to %s: %s", OLLAMA_BASE_URL, e)
+        logger.error("   Please ensure Ollama is running and accessible.")
         return False
     except Exception as e:
-        logger.error(f"❌ Ollama connection test failed: {e}")
-        _log_to_file(f"❌ Ollama connection test failed: {e}", "ERROR")
+        logger.error("❌ Ollama connection test failed: %s", e)
         logger.exception("Full error details:")
         _log_to_file(f"Full error details: {str(e)}", "ERROR")
         return False
@@ -264,11 +371,18 @@ def call_ollama(prompt: str, max_retries: int = 3) -> Optional[str]:
     _log_to_file("STEP: Calling Ollama API for Transcript Analysis")
     _log_to_file("=" * 80)
     
+    cached_response = get_cached_response(OLLAMA_MODEL, prompt)
+    if cached_response:
+        logger.info("⚡ Using cached Ollama response (%s characters)", len(cached_response))
+        _log_to_file("=" * 80)
+        return cached_response
+    
     url = f"{OLLAMA_BASE_URL}/api/generate"
     payload = {
         "model": OLLAMA_MODEL,
         "prompt": prompt,
-        "stream": False,
+        "stream": True,
+        "keep_alive": OLLAMA_KEEP_ALIVE,
         "options": {
             "temperature": 0.1,
             "top_p": 0.9,
@@ -276,45 +390,34 @@ def call_ollama(prompt: str, max_retries: int = 3) -> Optional[str]:
         }
     }
     
-    # Log the full prompt being sent
-    _log_to_file("📤 FULL PROMPT BEING SENT TO OLLAMA:")
-    _log_to_file("-" * 80)
-    _log_to_file(prompt)
-    _log_to_file("-" * 80)
-    _log_to_file(f"Prompt length: {len(prompt)} characters")
+    # Log the full prompt being sent (DEBUG only, it embeds the whole transcript)
+    if _log_file_debug_enabled():
+        _log_to_file("📤 FULL PROMPT BEING SENT TO OLLAMA:", "DEBUG")
+        _log_to_file("-" * 80, "DEBUG")
+        _log_to_file(prompt, "DEBUG")
+        _log_to_file("-" * 80, "DEBUG")
+        _log_to_file(f"📤 Full request payload:", "DEBUG")
+        _log_to_file(_json_dumps(payload), "DEBUG")
+    
+    # Request details don't change between attempts, so log them once
+    logger.info(
+        "📋 Ollama request - URL: %s | Model: %s | Prompt length: %s characters | Timeout: %s seconds (%s minutes)",
+        url, OLLAMA_MODEL, len(prompt), OLLAMA_TIMEOUT, OLLAMA_TIMEOUT // 60
+    )
     
-    # Use a session with extended timeout settings
-    session = requests.Session()
-    session.timeout = OLLAMA_TIMEOUT
+    # Reuse the shared keep-alive session; timeouts are passed per request
+    session = _get_ollama_session()
     
     for attempt in range(max_retries + 1):
         try:
             if attempt > 0:
                 wait_time = 5  # Wait 5 minutes between retries
-                logger.warning(f"🔄 Retrying Ollama request (attempt {attempt + 1}/{max_retries + 1}) after {wait_time*60}s...")
-                _log_to_file(f"🔄 Retrying Ollama request (attempt {attempt + 1}/{max_retries + 1}) after {wait_time*60}s...", "WARNING")
-                logger.info(f"⏳ Waiting {wait_time} minutes before retry...")
-                _log_to_file(f"⏳ Waiting {wait_time} minutes before retry...")
+                logger.warning("🔄 Retrying Ollama request in %s minutes...", wait_time)
                 time.sleep(wait_time * 60)
             
-            logger.info(f"📤 Calling Ollama API (attempt {attempt + 1}/{max_retries + 1})...")
-            _log_to_file(f"📤 Calling Ollama API (attempt {attempt + 1}/{max_retries + 1})...")
-            logger.info(f"   URL: {url}")
-            _log_to_file(f"   URL: {url}")
-            logger.info(f"   Model: {OLLAMA_MODEL}")
-            _log_to_file(f"   Model: {OLLAMA_MODEL}")
-            logger.info(f"   Prompt length: {len(prompt)} characters")
-            _log_to_file(f"   Prompt length: {len(prompt)} characters")
-            logger.info(f"   Timeout: {OLLAMA_TIMEOUT} seconds ({OLLAMA_TIMEOUT//60} minutes)")
-            _log_to_file(f"   Timeout: {OLLAMA_TIMEOUT} seconds ({OLLAMA_TIMEOUT//60} minutes)")
-            logger.info(f"   ⏰ This request will wait up to {OLLAMA_TIMEOUT//60} minutes for response...")
-            _log_to_file(f"   ⏰ This request will wait up to {OLLAMA_TIMEOUT//60} minutes for response...")
+            logger.info("📤 Calling Ollama API (attempt %s/%s)...", attempt + 1, max_retries + 1)
             
-            # Log the full payload
-            _log_to_file(f"📤 Full request payload:")
-            _log_to_file(json.dumps(payload, indent=2))
-            
-            # Make the actual request - this will block for up to OLLAMA_TIMEOUT seconds
+            # Make the actual request - each read waits up to OLLAMA_TIMEOUT seconds
             request_start = time.time()
             _log_to_file(f"⏳ Sending request to Ollama at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}...")
             response = None
@@ -322,25 +425,41 @@ def call_ollama(prompt: str, max_retries: int = 3) -> Optional[str]:
             result = None
             
             try:
-                response = session.post(url, json=payload, timeout=OLLAMA_TIMEOUT)
+                # Stream the generation: the timeout now bounds the wait between chunks
+                # rather than the whole generation, and tokens are collected as they arrive
+                response = session.post(url, json=payload, timeout=OLLAMA_TIMEOUT, stream=True)
                 response.raise_for_status()
                 
+                first_chunk_time = time.time() - request_start
+                logger.info("✅ Ollama API started streaming with status %s after %.2fs (%.1f minutes)", response.status_code, first_chunk_time, first_chunk_time//60)
+                
+                response_chunks: List[str] = []
+                with response:
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        try:
+                            chunk = json.loads(line)
+                        except ValueError as json_error:
+                            _log_to_file(f"⚠️ Failed to parse stream chunk as JSON: {json_error}", "WARNING")
+                            _log_to_file(f"Raw chunk (first 500 chars): {line[:500]!r}", "WARNING")
+                            continue
+                        if chunk.get("error"):
+                            # Surface as a failed attempt so the retry logic below applies
+                            raise ValueError(f"Ollama reported an error mid-stream: {chunk['error']}")
+                        response_chunks.append(chunk.get("response", ""))
+                        if chunk.get("done"):
+                            # The final chunk carries the timing stats and context
+                            result = chunk
+                            break
+                
                 request_time = time.time() - request_start
-                logger.info(f"✅ Ollama API responded with status {response.status_code} after {request_time:.2f}s ({request_time//60:.1f} minutes)")
-                _log_to_file(f"✅ Ollama API responded with status {response.status_code} after {request_time:.2f}s ({request_time//60:.1f} minutes)")
+                logger.info("✅ Ollama generation finished after %.2fs (%.1f minutes)", request_time, request_time//60)
                 _log_to_file(f"⏰ Response received at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+                if result is None:
+                    _log_to_file("⚠️ Stream ended without a final 'done' chunk; using the partial response", "WARNING")
                 
-                # Always try to get the response, even if JSON parsing fails
-                try:
-                    result = response.json()
-                except Exception as json_error:
-                    _log_to_file(f"⚠️ Failed to parse response as JSON: {json_error}", "WARNING")
-                    _log_to_file(f"Raw response text (first 5000 chars): {response.text[:5000]}", "WARNING")
-                    # Try to extract response text from raw response
-                    response_text = response.text.strip()
-                    result = {"response": response_text}
-                
-                response_text = result.get("response", "").strip() if result else response.text.strip() if response else ""
+                response_text = "".join(response_chunks).strip()
                 
                 # Log the full response - THIS IS CRITICAL
                 _log_to_file("📥 FULL RESPONSE FROM OLLAMA:")
@@ -350,10 +469,10 @@ def call_ollama(prompt: str, max_retries: int = 3) -> Optional[str]:
                 _log_to_file(response_text)
                 _log_to_file("-" * 80)
                 
-                if result:
+                if result and _log_file_debug_enabled():
                     try:
-                        _log_to_file(f"📥 Full response JSON:")
-                        _log_to_file(json.dumps(result, indent=2))
+                        _log_to_file(f"📥 Full response JSON:", "DEBUG")
+                        _log_to_file(_json_dumps(result), "DEBUG")
                     except Exception as e:
                         _log_to_file(f"⚠️ Could not serialize response JSON: {e}", "WARNING")
                         _log_to_file(f"Response type: {type(result)}")
@@ -361,18 +480,14 @@ def call_ollama(prompt: str, max_retries: int = 3) -> Optional[str]:
                 _log_to_file("-" * 80)
                 
                 if response_text:
-                    logger.info(f"✅ Received response from Ollama ({len(response_text)} characters)")
-                    _log_to_file(f"✅ Successfully received response from Ollama ({len(response_text)} characters)")
-                    logger.debug(f"Response preview (first 200 chars): {response_text[:200]}")
-                    _log_to_file(f"Response preview (first 200 chars): {response_text[:200]}")
+                    logger.info("✅ Received response from Ollama (%s characters)", len(response_text))
+                    logger.debug("Response preview (first 200 chars): %s", response_text[:200])
                     _log_to_file("=" * 80)
                     return response_text
                 else:
-                    logger.warning(f"⚠️ Ollama returned empty response")
-                    _log_to_file(f"⚠️ Ollama returned empty response", "WARNING")
+                    logger.warning("⚠️ Ollama returned empty response")
                     if attempt < max_retries:
-                        logger.info(f"🔄 Will retry in 5 minutes...")
-                        _log_to_file(f"🔄 Will retry in 5 minutes...")
+                        logger.info("🔄 Will retry in 5 minutes...")
                         continue
                     return None
                     
@@ -389,70 +504,97 @@ def call_ollama(prompt: str, max_retries: int = 3) -> Optional[str]:
             
         except requests.exceptions.Timeout as e:
             request_time = time.time() - request_start if 'request_start' in locals() else OLLAMA_TIMEOUT
-            logger.error(f"❌ Ollama API call timed out after {OLLAMA_TIMEOUT}s ({OLLAMA_TIMEOUT//60} minutes) - attempt {attempt + 1}/{max_retries + 1}")
-            _log_to_file(f"❌ Ollama API call timed out after {OLLAMA_TIMEOUT}s ({OLLAMA_TIMEOUT//60} minutes) - attempt {attempt + 1}/{max_retries + 1}", "ERROR")
-            logger.error(f"   This may indicate the model needs more time to process a very long transcript.")
-            _log_to_file(f"   This may indicate the model needs more time to process a very long transcript.", "ERROR")
-            logger.error(f"   Current timeout is {OLLAMA_TIMEOUT//60} minutes. Retrying...")
-            _log_to_file(f"   Current timeout is {OLLAMA_TIMEOUT//60} minutes. Retrying...", "ERROR")
+            logger.error("❌ Ollama API call timed out after %ss (%s minutes) - attempt %s/%s", OLLAMA_TIMEOUT, OLLAMA_TIMEOUT//60, attempt + 1, max_retries + 1)
+            logger.error("   This may indicate the model needs more time to process a very long transcript.")
+            logger.error("   Current timeout is %s minutes. Retrying...", OLLAMA_TIMEOUT//60)
             if attempt < max_retries:
-                logger.info(f"🔄 Will retry in 5 minutes...")
-                _log_to_file(f"🔄 Will retry in 5 minutes...")
+                logger.info("🔄 Will retry in 5 minutes...")
                 continue
-            logger.error(f"❌ All retries exhausted. Ollama did not respond within {OLLAMA_TIMEOUT//60} minutes.")
-            _log_to_file(f"❌ All retries exhausted. Ollama did not respond within {OLLAMA_TIMEOUT//60} minutes.", "ERROR")
+            logger.error("❌ All retries exhausted. Ollama did not respond within %s minutes.", OLLAMA_TIMEOUT//60)
             _log_to_file("=" * 80)
             return None
         except requests.exceptions.ConnectionError as e:
-            logger.error(f"❌ Ollama connection error (attempt {attempt + 1}/{max_retries + 1}): {e}")
-            _log_to_file(f"❌ Ollama connection error (attempt {attempt + 1}/{max_retries + 1}): {e}", "ERROR")
-            logger.error(f"   Please check if Ollama is running at {OLLAMA_BASE_URL}")
-            _log_to_file(f"   Please check if Ollama is running at {OLLAMA_BASE_URL}", "ERROR")
+            logger.error("❌ Ollama connection error (attempt %s/%s): %s", attempt + 1, max_retries + 1, e)
+            logger.error("   Please check if Ollama is running at %s", OLLAMA_BASE_URL)
             if attempt < max_retries:
-                logger.info(f"🔄 Will retry in 5 minutes...")
-                _log_to_file(f"🔄 Will retry in 5 minutes...")
+                logger.info("🔄 Will retry in 5 minutes...")
                 continue
             _log_to_file("=" * 80)
             return None
         except requests.exceptions.HTTPError as e:
-            logger.error(f"❌ Ollama HTTP error (attempt {attempt + 1}/{max_retries + 1}): {e}")
-            _log_to_file(f"❌ Ollama HTTP error (attempt {attempt + 1}/{max_retries + 1}): {e}", "ERROR")
+            logger.error("❌ Ollama HTTP error (attempt %s/%s): %s", attempt + 1, max_retries + 1, e)
             if e.response is not None:
-                logger.error(f"   Status code: {e.response.status_code}")
-                _log_to_file(f"   Status code: {e.response.status_code}", "ERROR")
-                logger.error(f"   Response: {e.response.text[:500]}")
-                _log_to_file(f"   Response: {e.response.text[:500]}", "ERROR")
+                logger.error("   Status code: %s", e.response.status_code)
+                logger.error("   Response: %s", e.response.text[:500])
             if attempt < max_retries:
-                logger.info(f"🔄 Will retry in 5 minutes...")
-                _log_to_file(f"🔄 Will retry in 5 minutes...")
+                logger.info("🔄 Will retry in 5 minutes...")
                 continue
             _log_to_file("=" * 80)
             return None
         except Exception as e:
-            logger.error(f"❌ Ollama API call failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
-            _log_to_file(f"❌ Ollama API call failed (attempt {attempt + 1}/{max_retries + 1}): {e}", "ERROR")
+            logger.error("❌ Ollama API call failed (attempt %s/%s): %s", attempt + 1, max_retries + 1, e)
             logger.exception("Full error details:")
             _log_to_file(f"Full error details: {str(e)}", "ERROR")
             if attempt < max_retries:
-                logger.info(f"🔄 Will retry in 5 minutes...")
-                _log_to_file(f"🔄 Will retry in 5 minutes...")
+                logger.info("🔄 Will retry in 5 minutes...")
                 continue
             _log_to_file("=" * 80)
             return None
     
-    logger.error(f"❌ All {max_retries + 1} attempts to call Ollama failed")
-    _log_to_file(f"❌ All {max_retries + 1} attempts to call Ollama failed", "ERROR")
+    logger.error("❌ All %s attempts to call Ollama failed", max_retries + 1)
     _log_to_file("=" * 80)
     return None
 
+# Caps in-flight Ollama work from async callers at the server's parallelism;
+# the blocking HTTP call runs in a worker thread so the event loop stays free
+_ollama_semaphore = asyncio.Semaphore(max(1, OLLAMA_NUM_PARALLEL))
+
 # --- Constants and Helpers ------------------------------------------------------
 MIN_SEGMENT_DURATION = 30  # 30 seconds minimum for viral clips
 MAX_SEGMENT_DURATION = 60  # 60 seconds maximum (1 minute)
 MIN_SEGMENTS = 3
 MAX_SEGMENTS = 5  # Reduced to 5 for faster processing
 
+# Keys the model may use for the segments list, preferred key first
+SEGMENT_LIST_KEYS = ("most_relevant_segments", "segments", "clips", "relevant_segments", "top_segments")
+_ALT_SEGMENT_LIST_KEYS = SEGMENT_LIST_KEYS[1:]
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+def _iter_json_candidates(text: str):
+    """Yield (source, parsed object) pairs from a model response, cheapest strategy first."""
+    # Whole response is the JSON object
+    try:
+        yield "direct", _json_loads(text.strip())
+    except ValueError as e:
+        _log_to_file(f"Direct JSON parse failed: {str(e)}", "WARNING")
+    
+    # Markdown code blocks (```json ... ```)
+    for i, match in enumerate(_JSON_BLOCK_RE.finditer(text)):
+        try:
+            yield f"code block {i+1}", _json_loads(match.group(1))
+        except ValueError as e:
+            _log_to_file(f"Failed to parse code block {i+1}: {str(e)}")
+    
+    # Objects embedded in prose: raw_decode parses from each candidate '{'
+    # to the matching end of the object in one C-level pass
+    start = text.find('{')
+    while start != -1:
+        try:
+            result, end = _JSON_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
+            start = text.find('{', start + 1)
+            continue
+        yield f"object at position {start}", result
+        start = text.find('{', end)
+
 def extract_json_from_text(text: str) -> Optional[dict]:
-    """Extract JSON object from Ollama response."""
+    """Extract JSON object from Ollama response.
+    
+    Prefers the first object carrying a segments list, so a stray '{}' or a
+    nested fragment ahead of the real answer is not mistaken for it.
+    """
     _log_to_file("🔍 Extracting JSON from text...")
     _log_to_file(f"Input text length: {len(text) if text else 0} characters")
     
@@ -463,68 +605,26 @@ def extract_json_from_text(text: str) -> Optional[dict]:
     # Log first 1000 characters for debugging
     _log_to_file(f"First 1000 characters of response: {text[:1000]}")
     
-    # Try direct JSON parse first
-    try:
-        result = json.loads(text.strip())
-        _log_to_file("✅ Successfully parsed JSON directly")
-        _log_to_file(f"Parsed JSON keys: {list(result.keys()) if isinstance(result, dict) else 'Not a dict'}")
-        if isinstance(result, dict) and "most_relevant_segments" in result:
-            segments_count = len(result.get("most_relevant_segments", []))
-            _log_to_file(f"Found {segments_count} segments in JSON")
-        return result
-    except json.JSONDecodeError as e:
-        _log_to_file(f"Direct JSON parse failed: {str(e)} at position {e.pos}", "WARNING")
-        _log_to_file(f"Error context: {text[max(0, e.pos-50):e.pos+50]}", "WARNING")
-    except Exception as e:
-        _log_to_file(f"Direct JSON parse failed with unexpected error: {str(e)}", "WARNING")
-    
-    # Look for JSON object in text - try to find markdown code blocks first
-    _log_to_file("Trying to extract JSON from markdown code blocks or plain text...")
-    
-    # Try to find markdown code blocks (```json ... ```)
-    json_block_pattern = r'```(?:json)?\s*(\{.*?\})\s*```'
-    matches = re.findall(json_block_pattern, text, re.DOTALL)
-    if matches:
-        _log_to_file(f"Found {len(matches)} potential JSON code blocks in markdown")
-        for i, match in enumerate(matches):
-            try:
-                result = json.loads(match.strip())
-                _log_to_file(f"✅ Successfully extracted JSON from code block {i+1}")
-                return result
-            except Exception as e:
-                _log_to_file(f"Failed to parse code block {i+1}: {str(e)}")
+    fallback = None
+    for source, result in _iter_json_candidates(text):
+        if not isinstance(result, dict):
+            continue
+        segments_key = next((key for key in SEGMENT_LIST_KEYS if key in result), None)
+        if segments_key is not None:
+            _log_to_file(f"✅ Successfully extracted JSON from {source}")
+            _log_to_file(f"Parsed JSON keys: {list(result.keys())}")
+            _log_to_file(f"Found {len(result[segments_key]) if isinstance(result[segments_key], list) else 'N/A'} segments under '{segments_key}'")
+            return result
+        if fallback is None:
+            fallback = (source, result)
     
-    # Look for JSON object in text
-    start = text.find('{')
-    if start == -1:
-        _log_to_file("❌ No opening brace found in text", "ERROR")
-        _log_to_file(f"Full response text for debugging:\n{text}", "ERROR")
-        return None
+    if fallback is not None:
+        source, result = fallback
+        _log_to_file(f"⚠️ No JSON object with a segments list; using {source}", "WARNING")
+        _log_to_file(f"Parsed JSON keys: {list(result.keys())}")
+        return result
     
-    _log_to_file(f"Found opening brace at position {start}")
-    depth = 0
-    end_positions = []
-    for i in range(start, len(text)):
-        if text[i] == '{':
-            depth += 1
-        elif text[i] == '}':
-            depth -= 1
-            if depth == 0:
-                end_positions.append(i)
-                try:
-                    json_str = text[start:i+1]
-                    result = json.loads(json_str)
-                    _log_to_file(f"✅ Successfully extracted JSON object (length: {i+1-start} characters)")
-                    _log_to_file(f"Parsed JSON keys: {list(result.keys()) if isinstance(result, dict) else 'Not a dict'}")
-                    if isinstance(result, dict) and "most_relevant_segments" in result:
-                        segments_count = len(result.get("most_relevant_segments", []))
-                        _log_to_file(f"Found {segments_count} segments in extracted JSON")
-                    return result
-                except Exception as e:
-                    _log_to_file(f"Failed to parse JSON at position {start}-{i+1}: {str(e)}")
-                    continue
-    
-    _log_to_file(f"❌ Failed to extract valid JSON object. Found {len(end_positions)} potential end positions", "ERROR")
+    _log_to_file("❌ Failed to extract valid JSON object", "ERROR")
     _log_to_file(f"Full response text for debugging:\n{text}", "ERROR")
     return None
 
@@ -532,6 +632,12 @@ def parse_timestamp_to_seconds(ts: str) -> int:
     """Parse timestamp string to seconds."""
     if not isinstance(ts, str):
         raise ValueError("Timestamp must be a string")
+    return _parse_timestamp_cached(ts)
+
+# The same MM:SS strings come back from validation, fallback expansion and
+# re-validation, so parsed values are memoized (invalid input still raises)
+@lru_cache(maxsize=4096)
+def _parse_timestamp_cached(ts: str) -> int:
     ts = ts.strip()
     parts = ts.split(':')
     if len(parts) == 2:
@@ -551,40 +657,73 @@ def parse_timestamp_to_seconds(ts: str) -> int:
         raise ValueError("Negative timestamp not allowed")
     return hours_i * 3600 + minutes_i * 60 + seconds_i
 
-def _parse_transcript_lines(transcript: str) -> List[Dict[str, Any]]:
-    """Parse transcript lines of the form [MM:SS - MM:SS] text into structured entries."""
-    entries: List[Dict[str, Any]] = []
-    pattern = re.compile(r"\[(\d{2}:\d{2})\s*-\s*(\d{2}:\d{2})\]\s*(.*)")
-    for line in transcript.splitlines():
-        match = pattern.match(line.strip())
-        if not match:
-            continue
-        start, end, text = match.groups()
-        try:
-            start_s = parse_timestamp_to_seconds(start)
-            end_s = parse_timestamp_to_seconds(end)
-            if end_s <= start_s:
-                continue
-            entries.append({
-                "start_time": start,
-                "end_time": end,
-                "start_s": start_s,
-                "end_s": end_s,
-                "text": text or ""
-            })
-        except Exception:
+# Matches one "[MM:SS - MM:SS] text" transcript line; minutes/seconds are captured
+# separately so they can be converted to ints without re-splitting the timestamp
+_TRANSCRIPT_LINE_RE = re.compile(
+    r"^[ \t]*\[((\d{2}):(\d{2}))[ \t]*-[ \t]*((\d{2}):(\d{2}))\][ \t]*([^\r\n]*)",
+    re.MULTILINE
+)
+
+def _parse_transcript_lines(transcript: str) -> Tuple[List[int], List[int], List[str]]:
+    """Parse transcript lines of the form [MM:SS - MM:SS] text.
+    
+    Returns parallel lists of start seconds, end seconds and text, ordered by
+    start time, so lookups and joins work on plain lists rather than dicts.
+    """
+    starts: List[int] = []
+    ends: List[int] = []
+    texts: List[str] = []
+    for match in _TRANSCRIPT_LINE_RE.finditer(transcript):
+        _, start_m, start_sec, _, end_m, end_sec, text = match.groups()
+        start_s = int(start_m) * 60 + int(start_sec)
+        end_s = int(end_m) * 60 + int(end_sec)
+        if end_s <= start_s:
             continue
-    return entries
+        starts.append(start_s)
+        ends.append(end_s)
+        texts.append(text.rstrip())
+    # Whisper emits lines chronologically; only reorder if one is out of place
+    if any(prev > nxt for prev, nxt in zip(starts, starts[1:])):
+        order = sorted(range(len(starts)), key=starts.__getitem__)
+        starts = [starts[i] for i in order]
+        ends = [ends[i] for i in order]
+        texts = [texts[i] for i in order]
+    return starts, ends, texts
+
+def _scan_expansion_end(entry_ends: List[int], ends_sorted: bool, start_idx: int, new_start_s: int) -> int:
+    """Return the index one past the last transcript line merged into a fallback segment.
+    
+    Lines are taken from start_idx until the segment reaches MIN_SEGMENT_DURATION,
+    stopping early once a line pushes it past MAX_SEGMENT_DURATION.
+    """
+    if ends_sorted:
+        # With non-decreasing end times the first line reaching the minimum is
+        # also the first one that could overshoot the maximum, so binary search
+        # finds the same stopping line as the scan below
+        k = bisect.bisect_left(entry_ends, new_start_s + MIN_SEGMENT_DURATION, start_idx)
+        return min(k, len(entry_ends) - 1) + 1
+    
+    new_end_s = entry_ends[start_idx]
+    j = start_idx + 1
+    while (new_end_s - new_start_s) < MIN_SEGMENT_DURATION and j < len(entry_ends):
+        # Take in the next line
+        new_end_s = entry_ends[j]
+        j += 1
+        if (new_end_s - new_start_s) > MAX_SEGMENT_DURATION:
+            break
+    return j
 
 def _expand_segments_with_transcript(transcript: str, segments_data: List[dict]) -> List[dict]:
     """Expand too-short segments by concatenating subsequent transcript lines until 10–45s.
     Keeps original start_time, grows end_time and text. Skips if cannot reach 10s.
     """
     _log_to_file("🔧 Fallback: Expanding too-short segments using transcript lines...")
-    entries = _parse_transcript_lines(transcript)
-    if not entries:
+    entry_starts, entry_ends, entry_texts = _parse_transcript_lines(transcript)
+    entry_count = len(entry_starts)
+    if not entry_count:
         _log_to_file("⚠️ Fallback aborted: transcript lines could not be parsed", "WARNING")
         return []
+    ends_sorted = all(prev <= nxt for prev, nxt in zip(entry_ends, entry_ends[1:]))
     expanded: List[dict] = []
     for idx, seg in enumerate(segments_data, 1):
         try:
@@ -599,27 +738,14 @@ def _expand_segments_with_transcript(transcript: str, segments_data: List[dict])
             continue
 
         # Find the first transcript entry at or after seg_start
-        start_idx = None
-        for i, e in enumerate(entries):
-            if e["start_s"] >= start_s - 1:  # allow slight drift
-                start_idx = i
-                break
-        if start_idx is None:
+        start_idx = bisect.bisect_left(entry_starts, start_s - 1)  # allow slight drift
+        if start_idx == entry_count:
             continue
 
-        # Expand forward until duration within bounds
-        combined_texts: List[str] = []
-        new_start_s = entries[start_idx]["start_s"]
-        new_end_s = entries[start_idx]["end_s"]
-        combined_texts.append(entries[start_idx]["text"])
-        j = start_idx + 1
-        while (new_end_s - new_start_s) < MIN_SEGMENT_DURATION and j < len(entries):
-            # Append next line
-            combined_texts.append(entries[j]["text"])
-            new_end_s = entries[j]["end_s"]
-            if (new_end_s - new_start_s) > MAX_SEGMENT_DURATION:
-                break
-            j += 1
+        # Expand forward until duration within bounds; lines start_idx..j-1 are taken
+        new_start_s = entry_starts[start_idx]
+        j = _scan_expansion_end(entry_ends, ends_sorted, start_idx, new_start_s)
+        new_end_s = entry_ends[j - 1]
 
         new_duration = new_end_s - new_start_s
         if new_duration < MIN_SEGMENT_DURATION or new_duration > (MAX_SEGMENT_DURATION + 2):
@@ -631,7 +757,7 @@ def _expand_segments_with_transcript(transcript: str, segments_data: List[dict])
         expanded_seg = {
             "start_time": f"{new_start_s//60:02d}:{new_start_s%60:02d}",
             "end_time": f"{new_end_s//60:02d}:{new_end_s%60:02d}",
-            "text": (base_text + " " + " ".join(combined_texts)).strip(),
+            "text": " ".join([base_text, *entry_texts[start_idx:j]]).strip(),
             "relevance_score": score,
             "reasoning": reasoning
         }
@@ -661,8 +787,8 @@ def validate_segments(segments_data: List[dict]) -> List[TranscriptSegment]:
             
             _log_to_file(f"  Segment {idx}: Validating {start_time}-{end_time} (score: {relevance_score})")
             
-            # Basic validation
-            if not text or len(text.split()) < 3:
+            # Basic validation (bounded split: only the first three words matter)
+            if not text or len(text.split(None, 3)) < 3:
                 _log_to_file(f"  Segment {idx}: Skipping (text too short)")
                 continue
                 
@@ -684,14 +810,16 @@ def validate_segments(segments_data: List[dict]) -> List[TranscriptSegment]:
                 end_time=end_time,
                 text=text,
                 relevance_score=relevance_score,
-                reasoning=reasoning
+                reasoning=reasoning,
+                start_sec=start_sec,
+                end_sec=end_sec
             )
             validated_segments.append(segment)
-            logger.info(f"✓ Valid segment: {start_time}-{end_time} ({duration}s) score={relevance_score:.2f}")
+            logger.info("✓ Valid segment: %s-%s (%ss) score=%.2f", start_time, end_time, duration, relevance_score)
             _log_to_file(f"  Segment {idx}: ✓ Valid ({start_time}-{end_time}, {duration}s, score={relevance_score:.2f})")
                            
         except (ValueError, KeyError) as e:
-            logger.warning(f"Skipping invalid segment: {e}")
+            logger.warning("Skipping invalid segment: %s", e)
             _log_to_file(f"  Segment {idx}: Skipping invalid segment: {str(e)}", "WARNING")
             continue
     
@@ -713,11 +841,10 @@ def validate_and_fix_json_data(json_data: dict) -> TranscriptAnalysis:
         # Check for alternative key names
         if not segments_data or len(segments_data) == 0:
             _log_to_file("⚠️ No segments found in 'most_relevant_segments', checking alternative keys...", "WARNING")
-            for alt_key in ["segments", "clips", "relevant_segments", "top_segments"]:
-                if alt_key in json_data:
-                    _log_to_file(f"Found alternative key: {alt_key} with {len(json_data[alt_key])} items")
-                    segments_data = json_data[alt_key]
-                    break
+            alt_key = next((key for key in _ALT_SEGMENT_LIST_KEYS if key in json_data), None)
+            if alt_key is not None:
+                _log_to_file(f"Found alternative key: {alt_key} with {len(json_data[alt_key])} items")
+                segments_data = json_data[alt_key]
         
         if not isinstance(segments_data, list):
             _log_to_file(f"⚠️ segments_data is not a list, it's {type(segments_data)}. Converting to empty list.", "WARNING")
@@ -754,8 +881,7 @@ def validate_and_fix_json_data(json_data: dict) -> TranscriptAnalysis:
         return result
         
     except Exception as e:
-        logger.error(f"Error validating JSON data: {e}")
-        _log_to_file(f"❌ Error validating JSON data: {str(e)}", "ERROR")
+        logger.error("Error validating JSON data: %s", e)
         import traceback
         _log_to_file(f"Traceback: {traceback.format_exc()}", "ERROR")
         return TranscriptAnalysis(
@@ -774,7 +900,6 @@ def get_most_relevant_parts_by_transcript(transcript: str) -> TranscriptAnalysis
     
     if not transcript or not transcript.strip():
         logger.error("Empty transcript provided")
-        _log_to_file("Empty transcript provided", "ERROR")
         return TranscriptAnalysis(
             most_relevant_segments=[],
             summary="No transcript provided",
@@ -782,36 +907,31 @@ def get_most_relevant_parts_by_transcript(transcript: str) -> TranscriptAnalysis
         )
 
     logger.info("Starting AI analysis of transcript (%d chars)", len(transcript))
-    _log_to_file(f"Starting AI analysis of transcript ({len(transcript)} characters)")
     _log_to_file(f"Transcript preview (first 500 chars): {transcript[:500]}")
     
-    # Step 1: Test Ollama connection first
-    logger.info("🔍 Step 1: Testing Ollama connection before analysis...")
-    _log_to_file("🔍 Step 1: Testing Ollama connection before analysis...")
-    if not test_ollama_connection():
-        logger.error("❌ Ollama connection test failed. Aborting transcript analysis.")
-        _log_to_file("❌ Ollama connection test failed. Aborting transcript analysis.", "ERROR")
-        return TranscriptAnalysis(
-            most_relevant_segments=[],
-            summary="Analysis failed: Ollama connection test failed",
-            key_topics=[]
-        )
-    
-    # Step 2: Format the prompt with the transcript
-    logger.info("📝 Step 2: Formatting prompt with transcript...")
-    _log_to_file("📝 Step 2: Formatting prompt with transcript...")
+    # Step 1: Format the prompt with the transcript
+    logger.info("📝 Step 1: Formatting prompt with transcript...")
     formatted_prompt = OLLAMA_SYSTEM_PROMPT.format(transcript=transcript)
-    logger.info(f"   Formatted prompt length: {len(formatted_prompt)} characters")
-    _log_to_file(f"   Formatted prompt length: {len(formatted_prompt)} characters")
+    logger.info("   Formatted prompt length: %s characters", len(formatted_prompt))
+    
+    # Step 2: Test Ollama connection first (not needed when the analysis is cached)
+    if get_cached_response(OLLAMA_MODEL, formatted_prompt):
+        logger.info("⚡ Step 2: Cached analysis found for this transcript, skipping connection test")
+    else:
+        logger.info("🔍 Step 2: Testing Ollama connection before analysis...")
+        if not test_ollama_connection():
+            logger.error("❌ Ollama connection test failed. Aborting transcript analysis.")
+            return TranscriptAnalysis(
+                most_relevant_segments=[],
+                summary="Analysis failed: Ollama connection test failed",
+                key_topics=[]
+            )
     
     try:
         # Step 3: Call Ollama API for actual analysis
         logger.info("🚀 Step 3: Calling Ollama API for transcript analysis...")
-        _log_to_file("🚀 Step 3: Calling Ollama API for transcript analysis...")
-        logger.info(f"⏰ Analysis timeout set to {OLLAMA_TIMEOUT} seconds ({OLLAMA_TIMEOUT//60} minutes)")
-        _log_to_file(f"⏰ Analysis timeout set to {OLLAMA_TIMEOUT} seconds ({OLLAMA_TIMEOUT//60} minutes)")
-        logger.info(f"⏰ This analysis may take 20-30 minutes. Please be patient and do not interrupt...")
-        _log_to_file(f"⏰ This analysis may take 20-30 minutes. Please be patient and do not interrupt...")
+        logger.info("⏰ Analysis timeout set to %s seconds (%s minutes)", OLLAMA_TIMEOUT, OLLAMA_TIMEOUT//60)
+        logger.info("⏰ This analysis may take 20-30 minutes. Please be patient and do not interrupt...")
         
         analysis_start = time.time()
         raw_text = call_ollama(formatted_prompt)
@@ -820,31 +940,30 @@ def get_most_relevant_parts_by_transcript(transcript: str) -> TranscriptAnalysis
         if not raw_text:
             raise ValueError("No response from Ollama after connection test succeeded")
         
-        logger.info(f"✅ Received response from Ollama ({len(raw_text)} characters) in {analysis_time:.2f}s ({analysis_time//60:.1f} minutes)")
-        _log_to_file(f"✅ Received response from Ollama ({len(raw_text)} characters) in {analysis_time:.2f}s ({analysis_time//60:.1f} minutes)")
+        logger.info("✅ Received response from Ollama (%s characters) in %.2fs (%.1f minutes)", len(raw_text), analysis_time, analysis_time//60)
         logger.debug("Raw model response preview (first 500 chars): %s", raw_text[:500])
         _log_to_file(f"Raw model response preview (first 500 chars): {raw_text[:500]}")
         
         # Step 4: Extract JSON from response
         logger.info("📋 Step 4: Extracting JSON from response...")
-        _log_to_file("📋 Step 4: Extracting JSON from response...")
         json_data = extract_json_from_text(raw_text)
         if not json_data:
             logger.error("❌ Failed to extract valid JSON from response")
-            _log_to_file("❌ Failed to extract valid JSON from response", "ERROR")
-            logger.debug(f"Response text: {raw_text[:1000]}")
+            logger.debug("Response text: %s", raw_text[:1000])
             _log_to_file(f"Response text (first 1000 chars): {raw_text[:1000]}", "ERROR")
             _log_to_file(f"Full response text for debugging:\n{raw_text}", "ERROR")
             raise ValueError("No valid JSON found in model response")
         
         logger.info("✅ Successfully extracted JSON from response")
-        _log_to_file("✅ Successfully extracted JSON from response")
-        _log_to_file(f"📋 Extracted JSON data:")
-        try:
-            _log_to_file(json.dumps(json_data, indent=2))
-        except Exception as e:
-            _log_to_file(f"Could not serialize JSON: {e}", "WARNING")
-            _log_to_file(f"JSON type: {type(json_data)}, keys: {list(json_data.keys()) if isinstance(json_data, dict) else 'N/A'}")
+        # The full document is already in the raw response dump; re-serialize
+        # it only when DEBUG payload logging is on
+        if _log_file_debug_enabled():
+            _log_to_file(f"📋 Extracted JSON data:", "DEBUG")
+            try:
+                _log_to_file(_json_dumps(json_data), "DEBUG")
+            except Exception as e:
+                _log_to_file(f"Could not serialize JSON: {e}", "WARNING")
+                _log_to_file(f"JSON type: {type(json_data)}, keys: {list(json_data.keys()) if isinstance(json_data, dict) else 'N/A'}")
         
         # Check if segments exist in the JSON
         if isinstance(json_data, dict):
@@ -857,19 +976,17 @@ def get_most_relevant_parts_by_transcript(transcript: str) -> TranscriptAnalysis
         
         # Step 5: Validate and convert to TranscriptAnalysis
         logger.info("✅ Step 5: Validating and processing segments...")
-        _log_to_file("✅ Step 5: Validating and processing segments...")
         analysis = validate_and_fix_json_data(json_data)
         
         logger.info("AI analysis returned %d candidate segments", len(analysis.most_relevant_segments))
-        _log_to_file(f"AI analysis returned {len(analysis.most_relevant_segments)} candidate segments")
         
-        # Sort by score and limit
-        analysis.most_relevant_segments.sort(key=lambda s: s.relevance_score, reverse=True)
-        analysis.most_relevant_segments = analysis.most_relevant_segments[:MAX_SEGMENTS]
+        # Keep the top-scoring segments (same order as a stable sort-then-slice)
+        analysis.most_relevant_segments = heapq.nlargest(
+            MAX_SEGMENTS, analysis.most_relevant_segments, key=attrgetter("relevance_score")
+        )
         
         if len(analysis.most_relevant_segments) < MIN_SEGMENTS:
             logger.warning("Only found %d valid segments (wanted %d)", len(analysis.most_relevant_segments), MIN_SEGMENTS)
-            _log_to_file(f"Only found {len(analysis.most_relevant_segments)} valid segments (wanted {MIN_SEGMENTS})", "WARNING")
             # Fallback: try to expand too-short segments using transcript
             try:
                 original_segments = json_data.get("most_relevant_segments", []) if isinstance(json_data, dict) else []
@@ -879,38 +996,50 @@ def get_most_relevant_parts_by_transcript(transcript: str) -> TranscriptAnalysis
                 revalidated = validate_segments(expanded_segments)
                 _log_to_file(f"🔧 Fallback re-validation produced {len(revalidated)} valid segments")
                 # Merge with existing (avoid duplicates by time window)
-                existing_keys = {(s.start_time, s.end_time) for s in analysis.most_relevant_segments}
+                existing_keys = {(s.start_sec, s.end_sec) for s in analysis.most_relevant_segments}
                 for s in revalidated:
-                    key = (s.start_time, s.end_time)
+                    key = (s.start_sec, s.end_sec)
                     if key not in existing_keys:
                         analysis.most_relevant_segments.append(s)
                         existing_keys.add(key)
-                # Resort and trim
-                analysis.most_relevant_segments.sort(key=lambda s: s.relevance_score, reverse=True)
-                analysis.most_relevant_segments = analysis.most_relevant_segments[:MAX_SEGMENTS]
+                # Re-rank and trim
+                analysis.most_relevant_segments = heapq.nlargest(
+                    MAX_SEGMENTS, analysis.most_relevant_segments, key=attrgetter("relevance_score")
+                )
                 _log_to_file(f"🔧 After fallback, have {len(analysis.most_relevant_segments)} segments")
             except Exception as e:
                 _log_to_file(f"Fallback expansion failed: {e}", "ERROR")
         
         logger.info("✅ Selected %d segments for processing", len(analysis.most_relevant_segments))
-        _log_to_file(f"✅ Selected {len(analysis.most_relevant_segments)} segments for processing")
         
-        # Log final analysis result
-        _log_to_file("=" * 80)
-        _log_to_file("FINAL ANALYSIS RESULT:")
-        _log_to_file("-" * 80)
-        _log_to_file(f"Summary: {analysis.summary}")
-        _log_to_file(f"Key Topics: {analysis.key_topics}")
-        _log_to_file(f"Number of segments: {len(analysis.most_relevant_segments)}")
+        # Only cache responses that produced a usable analysis, so a bad
+        # generation is retried next time instead of being replayed
+        if analysis.most_relevant_segments:
+            store_response(OLLAMA_MODEL, formatted_prompt, raw_text)
+        
+        # Log final analysis result as one multi-line record
+        result_lines = [
+            "=" * 80,
+            "FINAL ANALYSIS RESULT:",
+            "-" * 80,
+            f"Summary: {analysis.summary}",
+            f"Key Topics: {analysis.key_topics}",
+            f"Number of segments: {len(analysis.most_relevant_segments)}"
+        ]
         for i, segment in enumerate(analysis.most_relevant_segments, 1):
-            _log_to_file(f"Segment {i}:")
-            _log_to_file(f"  Start: {segment.start_time}, End: {segment.end_time}")
-            _log_to_file(f"  Score: {segment.relevance_score}")
-            _log_to_file(f"  Reasoning: {segment.reasoning}")
-            _log_to_file(f"  Text: {segment.text[:200]}...")
-        _log_to_file("-" * 80)
-        _log_to_file(f"Analysis completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        _log_to_file("=" * 80)
+            result_lines.extend((
+                f"Segment {i}:",
+                f"  Start: {segment.start_time}, End: {segment.end_time}",
+                f"  Score: {segment.relevance_score}",
+                f"  Reasoning: {segment.reasoning}",
+                f"  Text: {segment.text[:200]}..."
+            ))
+        result_lines.extend((
+            "-" * 80,
+            f"Analysis completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "=" * 80
+        ))
+        _log_to_file("\n".join(result_lines))
         
         return analysis
         
@@ -924,3 +1053,14 @@ def get_most_relevant_parts_by_transcript(transcript: str) -> TranscriptAnalysis
             summary=f"Analysis failed: {str(exc)}",
             key_topics=[]
         )
+    finally:
+        _flush_log_file()
+
+async def aget_most_relevant_parts_by_transcript(transcript: str) -> TranscriptAnalysis:
+    """Async variant of get_most_relevant_parts_by_transcript.
+    
+    Runs the analysis (connection test, Ollama call and response parsing) in a
+    worker thread, with concurrent analyses capped by the Ollama semaphore.
+    """
+    async with _ollama_semaphore:
+        return await asyncio.to_thread(get_most_relevant_parts_by_transcript, transcript)
@@ -1,4 +1,5 @@
 from dotenv import load_dotenv
+from functools import lru_cache
 import os
 import logging
 
@@ -9,14 +10,35 @@ class Config:
     def __init__(self):
         # Core video processing settings
         self.whisper_model = os.getenv("WHISPER_MODEL", "base")
+        self.whisper_compute_type = os.getenv("WHISPER_COMPUTE_TYPE", "int8")  # faster-whisper quantization
+        self.whisper_batch_size = int(os.getenv("WHISPER_BATCH_SIZE", "16"))  # faster-whisper chunks per forward pass; 1 disables batching
         self.max_video_duration = int(os.getenv("MAX_VIDEO_DURATION", "3600"))
+        # "MM:SS" label for every whole second a supported video can reach
+        self.timestamp_labels = tuple(f"{s // 60:02d}:{s % 60:02d}" for s in range(self.max_video_duration + 1))
         self.output_dir = os.getenv("OUTPUT_DIR", "outputs")
         self.max_clips = int(os.getenv("MAX_CLIPS", "10"))
         self.clip_duration = int(os.getenv("CLIP_DURATION", "30"))
+        # Worker processes used to render clips in parallel; 1 (default) renders serially in-process
+        self.clip_workers = int(os.getenv("CLIP_WORKERS", "1"))
         self.temp_dir = os.getenv("TEMP_DIR", "temp")
+        # "auto" prefers a working hardware H.264 encoder; any other value keeps libx264
+        self.video_encoder = os.getenv("VIDEO_ENCODER", "auto")
+        self.x264_preset = os.getenv("X264_PRESET", "veryfast")  # libx264 preset for "high" quality exports
+        # ffmpeg -hwaccel for decoding ("auto", "cuda", "videotoolbox", ...); "none" decodes on the CPU
+        self.video_hwaccel = os.getenv("VIDEO_HWACCEL", "auto")
+        # OpenCV YuNet ONNX model used when MediaPipe finds no faces (Haar cascade if the file is missing)
+        self.yunet_model_path = os.getenv(
+            "YUNET_MODEL_PATH",
+            os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models", "face_detection_yunet_2023mar.onnx")
+        )
         
         # Ollama configuration (for AI analysis)
         self.ollama_base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
         self.ollama_model = os.getenv("OLLAMA_MODEL", "llama3.1:8b-instruct-q6_K")
         
-        logger.info(f"✅ Config loaded - Whisper: {self.whisper_model}, Ollama: {self.ollama_model}")
\ No newline at end of file
+        logger.info(f"✅ Config loaded - Whisper: {self.whisper_model}, Ollama: {self.ollama_model}")
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide Config, reading the environment only once."""
+    return Config()
@@ -1,7 +1,7 @@
 from .youtube_utils import *
 from .video_utils import *
 from .ai import *
-from .config import Config
+from .config import get_config
 from datetime import datetime
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -35,7 +35,7 @@ from sqlalchemy import text
 from .models import User, Task, Source, GeneratedClip
 from .database import init_db, close_db, get_db, AsyncSessionLocal
 
-config = Config()
+config = get_config()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -43,6 +43,7 @@ async def lifespan(app: FastAPI):
         await init_db()
         yield
     finally:
+        shutdown_face_detector()
         await close_db()
 
 app = FastAPI(
@@ -184,25 +185,16 @@ async def start_task(request: Request):
         # Process video (same for both YouTube and uploaded videos)
         if video_path:
             logger.info("🎤 Starting transcript generation with Whisper")
-            transcript = get_video_transcript(video_path)
+            transcript = await asyncio.to_thread(get_video_transcript, video_path)
             logger.info(f"✅ Whisper transcript generated with 10-char line equalization (length: {len(transcript)} characters)")
 
             logger.info("🤖 Starting AI analysis for relevant segments")
-            relevant_parts = get_most_relevant_parts_by_transcript(transcript)
+            relevant_parts = await aget_most_relevant_parts_by_transcript(transcript)
             logger.info(f"✅ AI analysis complete - found {len(relevant_parts.most_relevant_segments)} segments")
 
             # Convert to JSON format for response
             logger.info("📊 Converting AI results to JSON format")
-            relevant_segments_json = [
-                {
-                    "start_time": segment.start_time,
-                    "end_time": segment.end_time,
-                    "text": segment.text,
-                    "relevance_score": segment.relevance_score,
-                    "reasoning": segment.reasoning
-                }
-                for segment in relevant_parts.most_relevant_segments
-            ]
+            relevant_segments_json = [segment.to_dict() for segment in relevant_parts.most_relevant_segments]
             logger.info(f"✅ Created {len(relevant_segments_json)} segment records")
 
             # Create clips from relevant segments with transitions and custom fonts
@@ -377,7 +369,7 @@ async def process_video_task(task_id: str, raw_source: dict, user_id: str, font_
         if video_path:
             logger.info(f"📊 Task {task_id}: Generating transcript with Whisper...")
             await update_task_status(task_id, "processing")
-            transcript = get_video_transcript(video_path)
+            transcript = await asyncio.to_thread(get_video_transcript, video_path)
             logger.info(f"✅ Transcript generated (length: {len(transcript)} characters)")
 
             logger.info(f"📊 Task {task_id}: AI analyzing content for best clips...")
@@ -385,7 +377,7 @@ async def process_video_task(task_id: str, raw_source: dict, user_id: str, font_
             await update_task_status(task_id, "AI analyzing content for best clips...")
             
             # This is the critical call - it will wait up to 30 minutes
-            relevant_parts = get_most_relevant_parts_by_transcript(transcript)
+            relevant_parts = await aget_most_relevant_parts_by_transcript(transcript)
             logger.info(f"✅ AI analysis complete - found {len(relevant_parts.most_relevant_segments)} segments")
 
             # Validate that we got segments
@@ -396,16 +388,7 @@ async def process_video_task(task_id: str, raw_source: dict, user_id: str, font_
                 raise Exception(error_msg)
 
             # Convert to JSON format
-            relevant_segments_json = [
-                {
-                    "start_time": segment.start_time,
-                    "end_time": segment.end_time,
-                    "text": segment.text,
-                    "relevance_score": segment.relevance_score,
-                    "reasoning": segment.reasoning
-                }
-                for segment in relevant_parts.most_relevant_segments
-            ]
+            relevant_segments_json = [segment.to_dict() for segment in relevant_parts.most_relevant_segments]
 
             logger.info(f"📊 Task {task_id}: Creating {len(relevant_segments_json)} video clips with transitions...")
             clips_output_dir = Path(config.temp_dir) / "clips"
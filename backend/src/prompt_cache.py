@@ -0,0 +1,97 @@
+"""
+Persistent cache for Ollama responses.
+Keyed on a SHA-256 of model + prompt so re-analysing the same transcript
+returns instantly instead of waiting on another 20-30 minute LLM call.
+"""
+from typing import Optional
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Default lives in backend/cache regardless of the working directory
+PROMPT_CACHE_FILE = os.getenv(
+    "OLLAMA_PROMPT_CACHE_FILE",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "ollama_prompt_cache.sqlite3")
+)
+PROMPT_CACHE_TTL = int(os.getenv("OLLAMA_PROMPT_CACHE_TTL", "604800"))  # 7 days; 0 disables the cache
+
+_connection = None
+_connection_lock = threading.Lock()
+
+def _get_connection() -> Optional[sqlite3.Connection]:
+    """Get or create the SQLite connection backing the prompt cache."""
+    global _connection
+
+    if _connection is not None:
+        return _connection
+
+    try:
+        cache_dir = os.path.dirname(PROMPT_CACHE_FILE)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        _connection = sqlite3.connect(PROMPT_CACHE_FILE, check_same_thread=False)
+        _connection.execute(
+            "CREATE TABLE IF NOT EXISTS prompt_cache ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at INTEGER NOT NULL)"
+        )
+        _connection.commit()
+        return _connection
+    except Exception as e:
+        logger.error("Failed to initialize prompt cache at %s: %s", PROMPT_CACHE_FILE, e)
+        _connection = None
+        return None
+
+def prompt_cache_key(model: str, prompt: str) -> str:
+    """Hash model name and whitespace-normalized prompt into a cache key."""
+    return hashlib.sha256(f"{model}\0{prompt.strip()}".encode("utf-8")).hexdigest()
+
+def get_cached_response(model: str, prompt: str) -> Optional[str]:
+    """Return a previously stored response for this model/prompt, or None."""
+    if PROMPT_CACHE_TTL <= 0:
+        return None
+
+    key = prompt_cache_key(model, prompt)
+    with _connection_lock:
+        conn = _get_connection()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT response, created_at FROM prompt_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            response, created_at = row
+            if time.time() - created_at > PROMPT_CACHE_TTL:
+                conn.execute("DELETE FROM prompt_cache WHERE key = ?", (key,))
+                conn.commit()
+                return None
+            return response
+        except Exception as e:
+            logger.warning("Prompt cache lookup failed: %s", e)
+            return None
+
+def store_response(model: str, prompt: str, response: str) -> None:
+    """Store a successful response for this model/prompt."""
+    if PROMPT_CACHE_TTL <= 0 or not response:
+        return
+
+    key = prompt_cache_key(model, prompt)
+    with _connection_lock:
+        conn = _get_connection()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO prompt_cache (key, response, created_at) VALUES (?, ?, ?)",
+                (key, response, int(time.time()))
+            )
+            conn.commit()
+        except Exception as e:
+            logger.warning("Prompt cache write failed: %s", e)
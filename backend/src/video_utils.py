@@ -6,28 +6,67 @@ when system packages are missing.
 """
 
 from pathlib import Path
+from functools import lru_cache
 from typing import List, Dict, Any, Tuple, Optional
+import importlib
 import os
 import logging
-import numpy as np
+import csv
 import json
 import tempfile
 import shutil
+import multiprocessing
 import subprocess
-import math
+import threading
+import wave
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import orjson
+
+    def _dump_json_bytes(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+    _load_json_bytes = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib encoder/parser
+    def _dump_json_bytes(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _load_json_bytes = json.loads
 
 logger = logging.getLogger(__name__)
 
 # Local config import (keep as you had)
-from .config import Config
-config = Config()
+from .config import get_config
+config = get_config()
 
 # ---------------------------------------------------------------------------
 # Lazy availability flags and helpers
 # ---------------------------------------------------------------------------
 _MOVIEPY_AVAILABLE = None
 _WHISPER_AVAILABLE = None
+_FASTER_WHISPER_AVAILABLE = None
 _IMAGEMAGICK_AVAILABLE = None
+_MOVIEPY_CLASSES = None
+
+class _LazyModule:
+    """Module proxy that defers the real import until first attribute access."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+# numpy is only needed once frames/words are processed; keep it off the import path
+np = _LazyModule("numpy")
+
+# Background blur runs at 1/BLUR_DOWNSCALE_FACTOR resolution for wide kernels
+BLUR_DOWNSCALE_FACTOR = 4
 
 # ---------------------------------------------------------------------------
 # Helper: safe gaussian blur using OpenCV (works with moviepy 1.0.x)
@@ -35,37 +74,60 @@ _IMAGEMAGICK_AVAILABLE = None
 def apply_gaussian_blur(clip, ksize: int = 35):
     """
     Apply gaussian blur to a moviepy clip using OpenCV.
-    Falls back to returning the original clip if OpenCV is unavailable.
+    Falls back to Pillow's GaussianBlur if OpenCV is unavailable (e.g. ARM
+    boxes without an opencv wheel), and to the original clip if neither is.
     """
+    # ksize must be odd and >=3 for GaussianBlur
+    k = max(3, int(ksize) | 1)
+    # The sigma cv2 derives from a k x k kernel
+    sigma = 0.3 * ((k - 1) * 0.5 - 1) + 0.8
+
     try:
         import cv2
     except Exception:
-        logger.warning("OpenCV not available; skipping blur effect")
-        return clip
+        try:
+            from PIL import Image, ImageFilter
+        except Exception:
+            logger.warning("Neither OpenCV nor Pillow available; skipping blur effect")
+            return clip
 
-    # ksize must be odd and >=3 for GaussianBlur
-    k = max(3, int(ksize) | 1)
-    return clip.fl_image(lambda frame: cv2.GaussianBlur(frame, (k, k), 0))
+        # Pillow's radius is the Gaussian's standard deviation
+        pil_filter = ImageFilter.GaussianBlur(radius=sigma)
 
+        def pil_blur(frame):
+            return np.asarray(Image.fromarray(np.ascontiguousarray(frame)).filter(pil_filter))
+
+        return clip.fl_image(pil_blur)
+
+    cv2.setUseOptimized(True)
+
+    # A wide blur keeps only low frequencies, so it can run on a downscaled frame
+    # and be upscaled again with no visible difference at a fraction of the cost
+    factor = BLUR_DOWNSCALE_FACTOR if k >= 4 * BLUR_DOWNSCALE_FACTOR else 1
+    # Keep the full-resolution sigma by scaling it with the frame; kernel size
+    # (0, 0) lets OpenCV size the separable kernel from sigma
+    sigma_small = sigma / factor
+
+    def blur(frame):
+        frame = np.ascontiguousarray(frame)
+        if factor == 1:
+            return cv2.GaussianBlur(frame, (k, k), 0)
+        height, width = frame.shape[:2]
+        small = cv2.resize(frame, (max(1, width // factor), max(1, height // factor)), interpolation=cv2.INTER_AREA)
+        small = cv2.GaussianBlur(small, (0, 0), sigma_small)
+        return cv2.resize(small, (width, height), interpolation=cv2.INTER_LINEAR)
+
+    return clip.fl_image(blur)
+
+@lru_cache(maxsize=None)
 def _check_executable_in_path(name: str) -> Optional[str]:
-    """Return path if executable exists on PATH, else None."""
+    """Return path if executable exists on PATH, else None (cached per process)."""
     path = shutil.which(name)
     return path
 
-def _check_imagemagick_availability():
-    """Check if ImageMagick is available and working with MoviePy."""
-    global _IMAGEMAGICK_AVAILABLE
-    if _IMAGEMAGICK_AVAILABLE is not None:
-        return _IMAGEMAGICK_AVAILABLE
-    
-    # First check if convert command is available
-    convert_path = _check_executable_in_path("convert")
-    if not convert_path:
-        logger.warning("ImageMagick 'convert' command not found on PATH")
-        _IMAGEMAGICK_AVAILABLE = False
-        return False
-    
-    # Test basic ImageMagick functionality
+@lru_cache(maxsize=1)
+def _check_convert_version() -> bool:
+    """Run `convert -version` once per process and report whether it succeeded."""
     try:
         result = subprocess.run(
             ["convert", "-version"],  # FIX: Use list instead of shell string
@@ -73,28 +135,113 @@ def _check_imagemagick_availability():
             text=True,
             timeout=10
         )
-        if result.returncode != 0:
-            logger.warning("ImageMagick version check failed")
-            _IMAGEMAGICK_AVAILABLE = False
-            return False
     except Exception as e:
         logger.warning(f"ImageMagick version check error: {e}")
-        _IMAGEMAGICK_AVAILABLE = False
         return False
-    
-    # Test MoviePy TextClip with ImageMagick
+    if result.returncode != 0:
+        logger.warning("ImageMagick version check failed")
+        return False
+    return True
+
+# Recovers most of the quality the veryfast preset gives up, at little encode cost
+X264_TUNING_PARAMS = ["-x264-params", "aq-mode=3:ref=2:bframes=2"]
+# Fixed 48-frame GOP without scene-cut keyframes: predictable seek points and clean segment cuts
+GOP_PARAMS = ["-g", "48", "-keyint_min", "48", "-sc_threshold", "0"]
+# moov atom up front so browsers can start playback before the whole file arrives
+FASTSTART_PARAMS = ["-movflags", "+faststart"]
+
+VAAPI_DEVICE = os.getenv("VAAPI_DEVICE", "/dev/dri/renderD128")
+
+# Hardware H.264 encoders in order of preference. "video_filter" is appended to the
+# video filter chain (VAAPI needs frames uploaded to the GPU); "constant_quality"
+# encoders take their rate control from params instead of the profile bitrate.
+_HW_H264_ENCODERS = (
+    {"codec": "h264_nvenc", "preset": "p4", "constant_quality": True,
+     "params": ["-rc", "vbr", "-cq", "23", "-b:v", "0", "-pix_fmt", "yuv420p"]},
+    {"codec": "h264_vaapi", "preset": "medium", "constant_quality": True,
+     "params": ["-vaapi_device", VAAPI_DEVICE, "-qp", "23"], "video_filter": "format=nv12,hwupload"},
+    {"codec": "h264_videotoolbox", "preset": "medium", "constant_quality": False,
+     "params": ["-pix_fmt", "yuv420p"]},
+    {"codec": "h264_qsv", "preset": "medium", "constant_quality": True,
+     "params": ["-global_quality", "23", "-pix_fmt", "nv12"]},
+)
+
+@lru_cache(maxsize=1)
+def _detect_hw_h264_encoder() -> Optional[Dict[str, Any]]:
+    """Return the first hardware H.264 encoder entry ffmpeg can actually use, or None."""
+    ffmpeg = _check_executable_in_path("ffmpeg")
+    if not ffmpeg:
+        return None
     try:
-        VideoFileClip, CompositeVideoClip, TextClip, concatenate_videoclips = _import_moviepy()
-        # Simple test without complex parameters
-        test_clip = TextClip(txt="test", fontsize=20, color='white')
-        test_clip.close()
-        _IMAGEMAGICK_AVAILABLE = True
-        logger.debug("ImageMagick TextClip functionality confirmed")
-        return True
+        listing = subprocess.run(
+            [ffmpeg, "-hide_banner", "-encoders"], capture_output=True, text=True, timeout=10
+        ).stdout
     except Exception as e:
-        logger.warning(f"ImageMagick TextClip test failed: {e}")
+        logger.debug("ffmpeg encoder listing failed: %s", e)
+        return None
+
+    for encoder in _HW_H264_ENCODERS:
+        if encoder["codec"] not in listing:
+            continue
+        # Encoders can be compiled in without a usable device; encode one tiny frame to be sure
+        probe_cmd = [ffmpeg, "-hide_banner", "-v", "error", "-f", "lavfi", "-i", "color=c=black:s=256x256",
+                     "-frames:v", "1", *encoder["params"]]
+        if encoder.get("video_filter"):
+            probe_cmd += ["-vf", encoder["video_filter"]]
+        probe_cmd += ["-c:v", encoder["codec"], "-f", "null", "-"]
+        try:
+            probe = subprocess.run(probe_cmd, capture_output=True, timeout=20)
+        except Exception:
+            continue
+        if probe.returncode == 0:
+            logger.info("🚀 Using hardware H.264 encoder: %s", encoder["codec"])
+            return encoder
+    logger.debug("No hardware H.264 encoder available; using libx264")
+    return None
+
+def _hwaccel_input_args() -> List[str]:
+    """Input options offloading decode to the GPU; ffmpeg falls back to software decode on its own."""
+    hwaccel = (config.video_hwaccel or "").strip().lower()
+    if not hwaccel or hwaccel == "none":
+        return []
+    return ["-hwaccel", hwaccel]
+
+def _ffmpeg_encode_args(encoding_settings: Dict[str, Any]) -> List[str]:
+    """Output options for an ffmpeg command line encoding with the given settings (video_filter excluded)."""
+    args = [
+        "-c:v", encoding_settings["codec"], "-preset", encoding_settings["preset"],
+        *(["-b:v", encoding_settings["bitrate"]] if encoding_settings.get("bitrate") else []),
+        *encoding_settings.get("ffmpeg_params", []),
+        "-c:a", encoding_settings["audio_codec"], "-b:a", encoding_settings["audio_bitrate"],
+        *FASTSTART_PARAMS,
+    ]
+    if _CLIP_FFMPEG_THREADS:
+        args += ["-threads", str(_CLIP_FFMPEG_THREADS), "-filter_complex_threads", str(_CLIP_FFMPEG_THREADS)]
+    return args
+
+def _writer_ffmpeg_params(encoding_settings: Dict[str, Any]) -> List[str]:
+    """ffmpeg_params for MoviePy's write_videofile, including any encoder-required video filter."""
+    params = [*encoding_settings.get("ffmpeg_params", []), *FASTSTART_PARAMS]
+    if encoding_settings.get("video_filter"):
+        params += ["-vf", encoding_settings["video_filter"]]
+    return params
+
+def _check_imagemagick_availability():
+    """Check if ImageMagick is available and working with MoviePy."""
+    global _IMAGEMAGICK_AVAILABLE
+    if _IMAGEMAGICK_AVAILABLE is not None:
+        return _IMAGEMAGICK_AVAILABLE
+    
+    # First check if convert command is available
+    convert_path = _check_executable_in_path("convert")
+    if not convert_path:
+        logger.warning("ImageMagick 'convert' command not found on PATH")
         _IMAGEMAGICK_AVAILABLE = False
         return False
+    
+    # Test basic ImageMagick functionality; TextClip failures surface in create_whisper_subtitles
+    _IMAGEMAGICK_AVAILABLE = _check_convert_version()
+    return _IMAGEMAGICK_AVAILABLE
 
 def _warn_missing_system_deps():
     """Log warnings about ffmpeg / ImageMagick presence (helpful diagnostics)."""
@@ -117,32 +264,27 @@ def _warn_missing_system_deps():
     else:
         logger.debug("ImageMagick found: %s", magick_path)
         # Test if ImageMagick works with basic command
-        try:
-            result = subprocess.run(["convert", "-version"], capture_output=True, text=True)  # FIX: Use list
-            if result.returncode == 0:
-                logger.debug("ImageMagick basic functionality confirmed")
-        except Exception as e:
-            logger.warning("ImageMagick basic test failed: %s", e)
+        if _check_convert_version():
+            logger.debug("ImageMagick basic functionality confirmed")
 
 def _import_moviepy():
     """Try to import moviepy editor API. Return module or raise with helpful message."""
-    global _MOVIEPY_AVAILABLE
+    global _MOVIEPY_AVAILABLE, _MOVIEPY_CLASSES
     if _MOVIEPY_AVAILABLE is not None:
         if _MOVIEPY_AVAILABLE:
-            # import lazily again to return actual classes
-            from moviepy.editor import VideoFileClip, CompositeVideoClip, TextClip, concatenate_videoclips
-            return VideoFileClip, CompositeVideoClip, TextClip, concatenate_videoclips
+            return _MOVIEPY_CLASSES
         raise RuntimeError("MoviePy marked unavailable")
 
     try:
         # Try canonical v2 import
         from moviepy.editor import VideoFileClip, CompositeVideoClip, TextClip, concatenate_videoclips
+        _MOVIEPY_CLASSES = (VideoFileClip, CompositeVideoClip, TextClip, concatenate_videoclips)
         _MOVIEPY_AVAILABLE = True
         
         # Check ImageMagick availability after MoviePy import
         _check_imagemagick_availability()
         
-        return VideoFileClip, CompositeVideoClip, TextClip, concatenate_videoclips
+        return _MOVIEPY_CLASSES
     except Exception as e:
         _MOVIEPY_AVAILABLE = False
         _warn_missing_system_deps()
@@ -170,6 +312,24 @@ def _import_whisper():
         logger.exception("whisper import failed: %s", e)
         raise RuntimeError("openai-whisper import failed. Ensure the package is installed.") from e
 
+def _import_faster_whisper():
+    """
+    Try to import faster-whisper (lazy). Returns (WhisperModel, BatchedInferencePipeline),
+    or None if not installed.
+    """
+    global _FASTER_WHISPER_AVAILABLE
+    if _FASTER_WHISPER_AVAILABLE is False:
+        return None
+
+    try:
+        from faster_whisper import WhisperModel, BatchedInferencePipeline
+        _FASTER_WHISPER_AVAILABLE = True
+        return WhisperModel, BatchedInferencePipeline
+    except Exception as e:
+        _FASTER_WHISPER_AVAILABLE = False
+        logger.info("faster-whisper not available (%s); falling back to openai-whisper", e)
+        return None
+
 # ---------------------------------------------------------------------------
 # VideoProcessor and model caching
 # ---------------------------------------------------------------------------
@@ -196,8 +356,9 @@ class VideoProcessor:
                 "audio_codec": "aac",
                 "bitrate": "8000k",
                 "audio_bitrate": "256k",
-                "preset": "medium",
-                "ffmpeg_params": ["-crf", "20", "-pix_fmt", "yuv420p", "-profile:v", "main", "-level", "4.1"]
+                "preset": config.x264_preset,
+                "ffmpeg_params": ["-crf", "23", "-pix_fmt", "yuv420p", "-profile:v", "main", "-level", "4.1",
+                                  *X264_TUNING_PARAMS, *GOP_PARAMS]
             },
             "medium": {
                 "codec": "libx264",
@@ -205,34 +366,137 @@ class VideoProcessor:
                 "bitrate": "4000k",
                 "audio_bitrate": "192k",
                 "preset": "fast",
-                "ffmpeg_params": ["-crf", "23", "-pix_fmt", "yuv420p"]
+                "ffmpeg_params": ["-crf", "23", "-pix_fmt", "yuv420p", *GOP_PARAMS]
             }
         }
-        return settings.get(target_quality, settings["high"])
+        selected = settings.get(target_quality, settings["high"])
+
+        hw_encoder = _detect_hw_h264_encoder() if config.video_encoder == "auto" else None
+        if hw_encoder is not None:
+            return {
+                **selected,
+                "codec": hw_encoder["codec"],
+                "preset": hw_encoder["preset"],
+                "bitrate": None if hw_encoder["constant_quality"] else selected["bitrate"],
+                "ffmpeg_params": [*hw_encoder["params"], *GOP_PARAMS],
+                "video_filter": hw_encoder.get("video_filter"),
+            }
+        return selected
 
 _whisper_model_cache = None
+_faster_whisper_model_cache = None
+
+def _load_audio_16k_mono(video_path: Path):
+    """
+    Return the video's audio as 16 kHz mono float32 samples (what Whisper consumes),
+    decoded by ffmpeg through a temporary WAV that is removed afterwards.
+    Returns None when ffmpeg is unavailable or decoding fails.
+    """
+    ffmpeg = _check_executable_in_path("ffmpeg")
+    if not ffmpeg:
+        return None
+    fd, tmp_path = tempfile.mkstemp(prefix="audio_16k_", suffix=".wav")
+    os.close(fd)
+    try:
+        subprocess.run(
+            [ffmpeg, "-nostdin", "-v", "error", "-y", "-i", str(video_path),
+             "-vn", "-ac", "1", "-ar", "16000", "-c:a", "pcm_s16le", "-f", "wav", tmp_path],
+            check=True, capture_output=True
+        )
+        with wave.open(tmp_path, "rb") as wav:
+            pcm = wav.readframes(wav.getnframes())
+        return np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+    except Exception as e:
+        logger.warning("Audio pre-decode failed for %s, letting Whisper decode it: %s", video_path, e)
+        return None
+    finally:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def _transcribe_with_faster_whisper(audio: Any) -> Optional[Dict[str, Any]]:
+    """
+    Transcribe with faster-whisper (CTranslate2, quantized) when it is installed.
+    `audio` is a media path or 16 kHz mono float32 samples.
+    Returns a dict shaped like openai-whisper's transcribe() result, or None
+    when faster-whisper is unavailable.
+    """
+    global _faster_whisper_model_cache
+    faster_whisper_classes = _import_faster_whisper()
+    if faster_whisper_classes is None:
+        return None
+    WhisperModel, BatchedInferencePipeline = faster_whisper_classes
+
+    if _faster_whisper_model_cache is None:
+        logger.info("Loading faster-whisper model: %s (compute_type=%s)", config.whisper_model, config.whisper_compute_type)
+        model = WhisperModel(
+            config.whisper_model,
+            device="auto",
+            compute_type=config.whisper_compute_type
+        )
+        # The batched pipeline splits speech into ~30s VAD chunks and decodes
+        # whisper_batch_size of them per forward pass instead of one at a time
+        if config.whisper_batch_size > 1:
+            model = BatchedInferencePipeline(model=model)
+        _faster_whisper_model_cache = model
+
+    # Greedy decoding matches openai-whisper's default; VAD skips silent stretches
+    transcribe_kwargs = {"batch_size": config.whisper_batch_size} if config.whisper_batch_size > 1 else {}
+    segments_iter, info = _faster_whisper_model_cache.transcribe(
+        audio,
+        task="transcribe",
+        beam_size=1,
+        word_timestamps=True,
+        vad_filter=True,
+        **transcribe_kwargs
+    )
+    segments = [
+        {
+            "id": segment.id,
+            "start": segment.start,
+            "end": segment.end,
+            "text": segment.text,
+            "words": [
+                {"word": word.word, "start": word.start, "end": word.end, "probability": word.probability}
+                for word in (segment.words or [])
+            ]
+        }
+        for segment in segments_iter
+    ]
+    return {
+        "text": "".join(segment["text"] for segment in segments),
+        "segments": segments,
+        "language": info.language
+    }
 
 def get_video_transcript(video_path: Path) -> str:
     """Get transcript using Whisper model; model loading is cached and lazy."""
     # Ensure Path object even if caller passed str
     video_path = Path(video_path)
-    whisper_mod = _import_whisper()
     global _whisper_model_cache
 
     logger.info("Getting transcript for: %s", video_path)
     try:
-        if _whisper_model_cache is None:
-            logger.info("Loading Whisper model: %s", getattr(config, "whisper_model", None))
-            _whisper_model_cache = whisper_mod.load_model(getattr(config, "whisper_model", "base"))
-        model = _whisper_model_cache
-
-        result = model.transcribe(
-            str(video_path),
-            verbose=False,
-            word_timestamps=True,
-            fp16=False,
-            task="transcribe"
-        )
+        # Decode once to 16 kHz mono; either whisper backend accepts the samples directly
+        audio = _load_audio_16k_mono(video_path)
+        audio_input = audio if audio is not None else str(video_path)
+
+        result = _transcribe_with_faster_whisper(audio_input)
+        if result is None:
+            whisper_mod = _import_whisper()
+            if _whisper_model_cache is None:
+                logger.info("Loading Whisper model: %s", getattr(config, "whisper_model", None))
+                _whisper_model_cache = whisper_mod.load_model(getattr(config, "whisper_model", "base"))
+            model = _whisper_model_cache
+
+            result = model.transcribe(
+                audio_input,
+                verbose=False,
+                word_timestamps=True,
+                fp16=False,
+                task="transcribe"
+            )
 
         formatted_lines: List[str] = []
         if result.get("segments"):
@@ -325,21 +589,35 @@ def cache_transcript_data(video_path: Path, transcript_data: dict) -> None:
         'language': transcript_data.get("language", "")
     }
     try:
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, indent=2, ensure_ascii=False)
+        # Machine-consumed cache: compact output, no pretty-printing
+        cache_path.write_bytes(_dump_json_bytes(cache_data))
         logger.info("Cached %d words to %s", len(words_data), cache_path)
     except Exception as e:
         logger.warning("Failed to write transcript cache to %s: %s", cache_path, e)
 
 def load_cached_transcript_data(video_path: Path) -> Optional[Dict]:
-    video_path = Path(video_path)
-    cache_path = video_path.with_suffix('.transcript_cache.json')
-    if not cache_path.exists():
+    """
+    Word-level Whisper data for a video, parsed once per process and reused by
+    every clip cut from it. The result is shared between callers; treat it as read-only.
+    """
+    cache_path = Path(video_path).with_suffix('.transcript_cache.json')
+    try:
+        mtime_ns = cache_path.stat().st_mtime_ns
+    except OSError:
         return None
+    return _load_transcript_cache(str(cache_path), mtime_ns)
+
+@lru_cache(maxsize=4)
+def _load_transcript_cache(cache_path: str, mtime_ns: int) -> Optional[Dict]:
+    """Parse a transcript cache file; the mtime key makes a re-transcribed video load fresh."""
+    cache_path = Path(cache_path)
     try:
-        with open(cache_path, 'r', encoding='utf-8') as f:
-            cached_data = json.load(f)
+        cached_data = _load_json_bytes(cache_path.read_bytes())
         cached_data['_source'] = 'whisper'
+        # Column arrays of word times (ms) so clips can window words with one vectorized mask
+        words = cached_data.get('words') or []
+        cached_data['_word_starts'] = np.fromiter((int(w.get('start', 0)) for w in words), dtype=np.int32, count=len(words))
+        cached_data['_word_ends'] = np.fromiter((int(w.get('end', 0)) for w in words), dtype=np.int32, count=len(words))
         return cached_data
     except Exception as e:
         logger.warning("Failed to load transcript cache %s: %s", cache_path, e)
@@ -349,26 +627,25 @@ def load_cached_transcript_data(video_path: Path) -> Optional[Dict]:
 def format_timestamp(seconds: float) -> str:
     if seconds is None:
         return "00:00"
-    minutes = int(seconds // 60)
-    seconds_i = int(seconds % 60)
-    return f"{minutes:02d}:{seconds_i:02d}"
+    if 0 <= seconds < len(config.timestamp_labels):
+        return config.timestamp_labels[int(seconds)]
+    minutes, seconds_rem = divmod(seconds, 60)
+    return f"{int(minutes):02d}:{int(seconds_rem):02d}"
 
 def parse_timestamp_to_seconds(timestamp_str: str) -> float:
     if timestamp_str is None:
         raise ValueError("timestamp_str is None")
-    ts = str(timestamp_str).strip()
+    ts = timestamp_str.strip() if isinstance(timestamp_str, str) else str(timestamp_str).strip()
     try:
-        if ':' in ts:
-            parts = ts.split(':')
-            if len(parts) == 2:
-                minutes = int(parts[0])
-                seconds = int(parts[1])
-                return minutes * 60 + seconds
-            elif len(parts) == 3:
-                hours = int(parts[0]); minutes = int(parts[1]); seconds = int(parts[2])
-                return hours * 3600 + minutes * 60 + seconds
-            else:
-                raise ValueError(f"Unsupported timestamp format: {ts}")
+        colons = ts.count(':')
+        if colons == 1:
+            minutes, seconds = ts.split(':')
+            return int(minutes) * 60 + int(seconds)
+        if colons == 2:
+            hours, minutes, seconds = ts.split(':')
+            return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+        if colons:
+            raise ValueError(f"Unsupported timestamp format: {ts}")
         return float(ts)
     except Exception as e:
         logger.debug("Failed to parse timestamp '%s': %s", ts, e)
@@ -377,6 +654,15 @@ def parse_timestamp_to_seconds(timestamp_str: str) -> float:
 def round_to_even(value: int) -> int:
     return value - (value % 2)
 
+def _weighted_face_center(face_centers: List[Tuple[int, int, int, float]]) -> Optional[Tuple[float, float]]:
+    """Area*confidence weighted centre of detected faces, or None if the weights sum to zero."""
+    faces = np.asarray(face_centers, dtype=np.float64)
+    weights = faces[:, 2] * faces[:, 3]
+    total_weight = weights.sum()
+    if total_weight <= 0:
+        return None
+    return float(faces[:, 0] @ weights / total_weight), float(faces[:, 1] @ weights / total_weight)
+
 # Face detection & cropping: keep implementations similar but lazy-import MediaPipe inside function
 def detect_optimal_square_crop_region(video_clip, start_time: float, end_time: float) -> Tuple[int, int, int, int]:
     """Detect optimal crop region for a square (1:1) aspect ratio, centered on faces."""
@@ -388,17 +674,12 @@ def detect_optimal_square_crop_region(video_clip, start_time: float, end_time: f
         new_height = round_to_even(crop_size)
 
         face_centers = detect_faces_in_clip(video_clip, start_time, end_time)
+        face_center = _weighted_face_center(face_centers) if face_centers else None
 
-        if face_centers:
-            total_weight = sum(area * confidence for _, _, area, confidence in face_centers)
-            if total_weight > 0:
-                weighted_x = sum(x * area * confidence for x, y, area, confidence in face_centers) / total_weight
-                weighted_y = sum(y * area * confidence for x, y, area, confidence in face_centers) / total_weight
-                x_offset = max(0, min(int(weighted_x - new_width // 2), original_width - new_width))
-                y_offset = max(0, min(int(weighted_y - new_height // 2), original_height - new_height))
-            else:
-                x_offset = (original_width - new_width) // 2 if original_width > new_width else 0
-                y_offset = (original_height - new_height) // 2 if original_height > new_height else 0
+        if face_center is not None:
+            weighted_x, weighted_y = face_center
+            x_offset = max(0, min(int(weighted_x - new_width // 2), original_width - new_width))
+            y_offset = max(0, min(int(weighted_y - new_height // 2), original_height - new_height))
         else:
             x_offset = (original_width - new_width) // 2 if original_width > new_width else 0
             y_offset = (original_height - new_height) // 2 if original_height > new_height else 0
@@ -428,18 +709,13 @@ def detect_optimal_crop_region(video_clip, start_time: float, end_time: float, t
             new_height = round_to_even(int(original_width / target_ratio))
 
         face_centers = detect_faces_in_clip(video_clip, start_time, end_time)
+        face_center = _weighted_face_center(face_centers) if face_centers else None
 
-        if face_centers:
-            total_weight = sum(area * confidence for _, _, area, confidence in face_centers)
-            if total_weight > 0:
-                weighted_x = sum(x * area * confidence for x, y, area, confidence in face_centers) / total_weight
-                weighted_y = sum(y * area * confidence for x, y, area, confidence in face_centers) / total_weight
-                weighted_y = max(0, weighted_y - new_height * 0.1)
-                x_offset = max(0, min(int(weighted_x - new_width // 2), original_width - new_width))
-                y_offset = max(0, min(int(weighted_y - new_height // 2), original_height - new_height))
-            else:
-                x_offset = (original_width - new_width) // 2 if original_width > new_width else 0
-                y_offset = (original_height - new_height) // 2 if original_height > new_height else 0
+        if face_center is not None:
+            weighted_x, weighted_y = face_center
+            weighted_y = max(0, weighted_y - new_height * 0.1)
+            x_offset = max(0, min(int(weighted_x - new_width // 2), original_width - new_width))
+            y_offset = max(0, min(int(weighted_y - new_height // 2), original_height - new_height))
         else:
             x_offset = (original_width - new_width) // 2 if original_width > new_width else 0
             y_offset = (original_height - new_height) // 2 if original_height > new_height else 0
@@ -461,24 +737,163 @@ def detect_optimal_crop_region(video_clip, start_time: float, end_time: float, t
         y_offset = round_to_even((original_height - new_height) // 2) if original_height > new_height else 0
         return (x_offset, y_offset, new_width, new_height)
 
+# Face detectors need only a few hundred pixels per side; larger frames are
+# downscaled to this long edge before detection
+FACE_DETECTION_MAX_EDGE = 480
+# Sampling stops once the weighted face centre moves less than this (pixels)
+# on two consecutive samples
+FACE_CENTER_STABLE_PX = 8
+
+# MediaPipe builds its inference graph on construction, so one detector is
+# created on first use and reused for every clip until shutdown_face_detector()
+_MP_FACE_DETECTOR = None
+_MP_FACE_DETECTOR_LOCK = threading.Lock()
+
+def _get_face_detector():
+    """Return the shared MediaPipe FaceDetection instance, creating it if needed."""
+    global _MP_FACE_DETECTOR
+    with _MP_FACE_DETECTOR_LOCK:
+        if _MP_FACE_DETECTOR is None:
+            import mediapipe as mp
+            _MP_FACE_DETECTOR = mp.solutions.face_detection.FaceDetection(model_selection=0, min_detection_confidence=0.5)
+        return _MP_FACE_DETECTOR
+
+def shutdown_face_detector() -> None:
+    """Release the shared MediaPipe detector (call on process teardown)."""
+    global _MP_FACE_DETECTOR
+    with _MP_FACE_DETECTOR_LOCK:
+        if _MP_FACE_DETECTOR is not None:
+            try:
+                _MP_FACE_DETECTOR.close()
+            except Exception:
+                pass
+            _MP_FACE_DETECTOR = None
+
+# YuNet detectors are bound to an input size, so keep one per (width, height)
+_YUNET_DETECTORS: Dict[Tuple[int, int], Any] = {}
+
+def _get_yunet_detector(cv2, width: int, height: int):
+    """Return a cached OpenCV YuNet face detector for this frame size, or None."""
+    key = (width, height)
+    if key in _YUNET_DETECTORS:
+        return _YUNET_DETECTORS[key]
+
+    detector = None
+    model_path = config.yunet_model_path
+    if model_path and os.path.exists(model_path) and hasattr(cv2, "FaceDetectorYN_create"):
+        try:
+            detector = cv2.FaceDetectorYN_create(model_path, "", key, 0.6)
+        except Exception as e:
+            logger.warning("Failed to load YuNet face detector from %s: %s", model_path, e)
+    else:
+        logger.debug("YuNet model not found at %s; falling back to the Haar cascade", model_path)
+    _YUNET_DETECTORS[key] = detector
+    return detector
+
+_HAAR_CASCADE = None
+
+def _get_haar_cascade(cv2):
+    """Return the frontal-face Haar cascade bundled with opencv-python, loaded once, or None."""
+    global _HAAR_CASCADE
+    if _HAAR_CASCADE is None:
+        try:
+            cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+            _HAAR_CASCADE = cascade if not cascade.empty() else False
+        except Exception:
+            logger.debug("Haar cascade not available for face detection")
+            _HAAR_CASCADE = False
+    return _HAAR_CASCADE or None
+
+def _decode_sample_frames(video_clip, sample_times: List[float]):
+    """Yield RGB frames for sample_times from a single ffmpeg pass.
+
+    ffmpeg seeks once to the first sample and a select filter keeps only the
+    sampled frame indices, instead of MoviePy re-seeking and decoding per
+    get_frame() call. Yields nothing when the clip isn't file-backed or ffmpeg
+    is missing; stops early if ffmpeg produces fewer frames than requested.
+    """
+    path = getattr(video_clip, "filename", None)
+    fps = getattr(video_clip, "fps", None)
+    ffmpeg = _check_executable_in_path("ffmpeg")
+    if not path or not fps or not sample_times or not ffmpeg:
+        return
+
+    start = sample_times[0]
+    indices = [round((t - start) * fps) for t in sample_times]
+    if len(set(indices)) != len(indices):
+        # Samples closer together than one frame; let get_frame() handle them
+        return
+
+    width, height = video_clip.size
+    frame_size = width * height * 3
+    select_expr = "+".join(f"eq(n\\,{i})" for i in indices)
+    cmd = [
+        ffmpeg, "-v", "error",
+        "-ss", f"{start:.3f}", "-i", str(path),
+        "-map", "0:v:0",
+        "-vf", f"select={select_expr}", "-vsync", "0",
+        "-frames:v", str(len(indices)),
+        "-f", "rawvideo", "-pix_fmt", "rgb24", "pipe:1",
+    ]
+    try:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=10**6)
+    except OSError as e:
+        logger.debug("ffmpeg frame decode unavailable: %s", e)
+        return
+
+    try:
+        for _ in indices:
+            raw = process.stdout.read(frame_size)
+            if len(raw) != frame_size:
+                break
+            yield np.frombuffer(raw, dtype=np.uint8).reshape(height, width, 3)
+    finally:
+        process.stdout.close()
+        if process.poll() is None:
+            process.kill()
+        process.wait()
+
+def _iter_sample_frames(video_clip, sample_times: List[float]):
+    """Yield (sample_time, frame) pairs, decoding via ffmpeg where possible."""
+    decoded = 0
+    for frame in _decode_sample_frames(video_clip, sample_times):
+        yield sample_times[decoded], frame
+        decoded += 1
+
+    # Whatever ffmpeg couldn't provide falls back to MoviePy
+    for sample_time in sample_times[decoded:]:
+        try:
+            frame = video_clip.get_frame(sample_time)
+        except Exception:
+            logger.debug("Error reading frame at %.2fs", sample_time)
+            continue
+        yield sample_time, frame
+
 def detect_faces_in_clip(video_clip, start_time: float, end_time: float) -> List[Tuple[int, int, int, float]]:
     face_centers: List[Tuple[int, int, int, float]] = []
     try:
-        # MediaPipe lazy import
+        # MediaPipe lazy import; the detector is shared across clips
         try:
-            import mediapipe as mp
-            mp_face_detection = mp.solutions.face_detection.FaceDetection(model_selection=0, min_detection_confidence=0.5)
+            mp_face_detection = _get_face_detector()
             use_mediapipe = True
         except Exception:
             mp_face_detection = None
             use_mediapipe = False
 
-        haar_cascade = None
+        cv2 = None
         try:
             import cv2
-            haar_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
         except Exception:
-            logger.debug("OpenCV or Haar cascade not available for face detection")
+            logger.debug("OpenCV not available for face detection")
+
+        # Bind per-frame helpers to locals before entering the sampling loop
+        detector_lock = _MP_FACE_DETECTOR_LOCK
+        uint8 = np.uint8
+
+        # Running area*confidence weighted centre for the early exit
+        total_weight = weighted_x = weighted_y = 0.0
+        prev_center = None
+        stable_samples = 0
 
         # sampling frames
         duration = max(0.1, end_time - start_time)
@@ -494,20 +909,32 @@ def detect_faces_in_clip(video_clip, start_time: float, end_time: float) -> List
                 sample_times.append(mid)
         sample_times = sorted(set([s for s in sample_times if s < end_time]))
 
-        for sample_time in sample_times:
+        for sample_time, frame in _iter_sample_frames(video_clip, sample_times):
             try:
-                frame = video_clip.get_frame(sample_time)
                 if frame is None:
                     continue
                 frame_rgb = frame
                 height, width = frame_rgb.shape[:2]
                 detected_faces = []
 
+                # Detect on a downscaled copy; MediaPipe boxes are relative and
+                # YuNet/Haar boxes are scaled back up, so results stay in full-frame pixels
+                scale = FACE_DETECTION_MAX_EDGE / max(height, width)
+                if scale < 1.0 and cv2 is not None:
+                    detect_frame = cv2.resize(frame_rgb, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+                else:
+                    detect_frame = frame_rgb
+                    scale = 1.0
+
                 if use_mediapipe and mp_face_detection is not None:
                     try:
-                        import mediapipe as mp
-                        frame_rgb_uint8 = frame_rgb.astype('uint8')
-                        results = mp_face_detection.process(frame_rgb_uint8)
+                        # Decoded frames are already uint8; only copy when dtype/layout require it
+                        if detect_frame.dtype == uint8 and detect_frame.flags['C_CONTIGUOUS']:
+                            frame_rgb_uint8 = detect_frame
+                        else:
+                            frame_rgb_uint8 = np.ascontiguousarray(detect_frame, dtype=uint8)
+                        with detector_lock:
+                            results = mp_face_detection.process(frame_rgb_uint8)
                         if results and getattr(results, "detections", None):
                             for detection in results.detections:
                                 bbox = detection.location_data.relative_bounding_box
@@ -521,26 +948,58 @@ def detect_faces_in_clip(video_clip, start_time: float, end_time: float) -> List
                     except Exception:
                         logger.debug("MediaPipe detection error at %.2fs", sample_time)
 
-                # Haar fallback
-                if not detected_faces and haar_cascade is not None:
+                # YuNet fallback, or the bundled Haar cascade when the YuNet model isn't installed
+                if not detected_faces and cv2 is not None:
                     try:
-                        import cv2
-                        frame_bgr = cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2BGR)
-                        gray = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2GRAY)
-                        faces = haar_cascade.detectMultiScale(gray, scaleFactor=1.05, minNeighbors=3, minSize=(40, 40))
-                        for (x, y, w, h) in faces:
-                            face_area = w * h
-                            relative_size = face_area / (width * height)
-                            confidence = min(0.9, 0.3 + relative_size * 2)
-                            detected_faces.append((x + w // 2, y + h // 2, face_area, confidence))
+                        detect_height, detect_width = detect_frame.shape[:2]
+                        yunet = _get_yunet_detector(cv2, detect_width, detect_height)
+                        frame_bgr = cv2.cvtColor(detect_frame, cv2.COLOR_RGB2BGR)
+                        if yunet is not None:
+                            _, faces = yunet.detect(frame_bgr)
+                            # Rows are [x, y, w, h, 5 landmark pairs, score]
+                            for face in (faces if faces is not None else ()):
+                                x, y, w, h = (int(v / scale) for v in face[:4])
+                                detected_faces.append((x + w // 2, y + h // 2, w * h, float(face[-1])))
+                        else:
+                            haar_cascade = _get_haar_cascade(cv2)
+                            if haar_cascade is not None:
+                                gray = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2GRAY)
+                                min_face = max(1, int(40 * scale))
+                                faces = haar_cascade.detectMultiScale(gray, scaleFactor=1.05, minNeighbors=3, minSize=(min_face, min_face))
+                                for (x, y, w, h) in faces:
+                                    x, y, w, h = (int(v / scale) for v in (x, y, w, h))
+                                    face_area = w * h
+                                    relative_size = face_area / (width * height)
+                                    confidence = min(0.9, 0.3 + relative_size * 2)
+                                    detected_faces.append((x + w // 2, y + h // 2, face_area, confidence))
                     except Exception:
-                        logger.debug("Haar detection error at %.2fs", sample_time)
+                        logger.debug("OpenCV face detection error at %.2fs", sample_time)
 
+                added_faces = False
                 for (cx, cy, area, conf) in detected_faces:
                     frame_area = width * height
                     relative_area = area / frame_area
                     if 0.005 < relative_area < 0.9:
                         face_centers.append((int(cx), int(cy), int(area), float(conf)))
+                        weight = area * conf
+                        total_weight += weight
+                        weighted_x += cx * weight
+                        weighted_y += cy * weight
+                        added_faces = True
+
+                # Stop sampling once the running weighted centre has settled
+                if added_faces and total_weight > 0:
+                    center = (weighted_x / total_weight, weighted_y / total_weight)
+                    if (prev_center is not None
+                            and abs(center[0] - prev_center[0]) < FACE_CENTER_STABLE_PX
+                            and abs(center[1] - prev_center[1]) < FACE_CENTER_STABLE_PX):
+                        stable_samples += 1
+                        if stable_samples >= 2:
+                            logger.debug("Face centre stable after %.2fs; stopping detection early", sample_time)
+                            break
+                    else:
+                        stable_samples = 0
+                    prev_center = center
 
             except Exception:
                 logger.debug("Error processing frame at %.2fs", sample_time)
@@ -548,12 +1007,6 @@ def detect_faces_in_clip(video_clip, start_time: float, end_time: float) -> List
 
     except Exception as e:
         logger.exception("Error in face detection: %s", e)
-    finally:
-        try:
-            if mp_face_detection is not None:
-                mp_face_detection.close()
-        except Exception:
-            pass
 
     # filter small outliers
     if len(face_centers) > 2:
@@ -564,21 +1017,110 @@ def filter_face_outliers(face_centers: List[Tuple[int, int, int, float]]) -> Lis
     if len(face_centers) < 3:
         return face_centers
     try:
-        x_positions = [x for x, y, area, conf in face_centers]
-        y_positions = [y for x, y, area, conf in face_centers]
-        median_x = np.median(x_positions)
-        median_y = np.median(y_positions)
-        std_x = np.std(x_positions)
-        std_y = np.std(y_positions)
-        filtered_faces = []
-        for face in face_centers:
-            x, y, area, conf = face
-            if (abs(x - median_x) <= 2 * std_x and abs(y - median_y) <= 2 * std_y):
-                filtered_faces.append(face)
-        return filtered_faces if filtered_faces else face_centers
+        faces = np.asarray(face_centers, dtype=np.float64)
+        x_positions = faces[:, 0]
+        y_positions = faces[:, 1]
+        keep = (
+            (np.abs(x_positions - np.median(x_positions)) <= 2 * x_positions.std()) &
+            (np.abs(y_positions - np.median(y_positions)) <= 2 * y_positions.std())
+        )
+        if not keep.any():
+            return face_centers
+        return [face for face, kept in zip(face_centers, keep) if kept]
     except Exception:
         return face_centers
 
+@lru_cache(maxsize=32)
+def _load_subtitle_font(font_name: str, font_size: int):
+    """Load a Pillow TrueType font by file path or family name, or None if unavailable."""
+    try:
+        from PIL import ImageFont
+    except Exception:
+        return None
+
+    candidates = [font_name]
+    if not font_name.lower().endswith((".ttf", ".otf")):
+        # ImageMagick-style names such as "DejaVu-Sans" map to files like DejaVuSans.ttf
+        candidates += [f"{font_name}.ttf", f"{font_name.replace('-', '')}.ttf"]
+    for candidate in candidates:
+        try:
+            return ImageFont.truetype(candidate, font_size)
+        except Exception:
+            continue
+    try:
+        # Pillow >= 10.1 ships a scalable built-in font
+        logger.debug("Pillow could not load font %s; using its built-in font", font_name)
+        return ImageFont.load_default(size=font_size)
+    except Exception:
+        logger.debug("Pillow could not load font %s", font_name)
+        return None
+
+@lru_cache(maxsize=512)
+def make_text_image(text: str, font_path: str, size: int, color: str):
+    """Rasterize text with Pillow into an RGBA ndarray, or None if no font could be loaded.
+
+    Cached because three-word subtitle groups repeat often across clips of the same video.
+    """
+    font = _load_subtitle_font(font_path, size)
+    if font is None:
+        return None
+    from PIL import Image, ImageDraw
+
+    _, _, right, bottom = font.getbbox(text)
+    image = Image.new("RGBA", (max(1, right), max(1, bottom)), (0, 0, 0, 0))
+    ImageDraw.Draw(image).text((0, 0), text, fill=color, font=font)
+    frame = np.asarray(image)
+    frame.setflags(write=False)  # shared between cache hits
+    return frame
+
+def _subtitle_font_size(font_size: int, video_width: int) -> int:
+    """Subtitle font size scaled to the output width: 1.5× multiplier, min 28, max 64."""
+    scale_multiplier = 1.5
+    calculated_font_size = int(font_size * (video_width / 720) * scale_multiplier)
+    return max(28, min(64, calculated_font_size))
+
+def _subtitle_groups(video_path: Path, clip_start: float, clip_end: float, words_per_subtitle: int = 3) -> List[Tuple[str, float, float]]:
+    """Group the cached Whisper words inside a clip into (text, start, end) subtitles, timed from the clip start."""
+    transcript_data = load_cached_transcript_data(video_path)
+    if not transcript_data or not transcript_data.get('words'):
+        logger.warning("No cached transcript data available for subtitles")
+        return []
+
+    clip_start_ms = int(clip_start * 1000)
+    clip_end_ms = int(clip_end * 1000)
+
+    words = transcript_data['words']
+    word_starts = transcript_data['_word_starts']
+    word_ends = transcript_data['_word_ends']
+    in_clip = np.nonzero((word_starts < clip_end_ms) & (word_ends > clip_start_ms))[0]
+
+    # Parallel lists of the words inside the clip, timed relative to the clip start
+    rel_texts: List[str] = []
+    rel_starts: List[float] = []
+    rel_ends: List[float] = []
+    for idx in in_clip:
+        word_start = int(word_starts[idx])
+        word_end = int(word_ends[idx])
+        relative_start = max(0, (word_start - clip_start_ms) / 1000.0)
+        relative_end = min((clip_end_ms - clip_start_ms) / 1000.0, (word_end - clip_start_ms) / 1000.0)
+        if relative_end > relative_start:
+            rel_texts.append(words[idx].get('text', ''))
+            rel_starts.append(relative_start)
+            rel_ends.append(relative_end)
+
+    if not rel_texts:
+        logger.warning("No words found in clip timerange")
+        return []
+
+    groups = []
+    word_count = len(rel_texts)
+    for i in range(0, word_count, words_per_subtitle):
+        segment_start = rel_starts[i]
+        segment_end = rel_ends[min(i + words_per_subtitle, word_count) - 1]
+        if segment_end - segment_start > 0:
+            groups.append((' '.join(rel_texts[i:i + words_per_subtitle]), segment_start, segment_end))
+    return groups
+
 def create_whisper_subtitles(
     video_path: Path,
     clip_start: float,
@@ -591,86 +1133,28 @@ def create_whisper_subtitles(
     square_y_position: int = None,
     square_size: int = None
 ) -> List[Any]:
-    # Ensure moviepy available
-    VideoFileClip, CompositeVideoClip, TextClip, concatenate_videoclips = _import_moviepy()
-    
-    transcript_data = load_cached_transcript_data(video_path)
-    if not transcript_data or not transcript_data.get('words'):
-        logger.warning("No cached transcript data available for subtitles")
-        return []
+    from moviepy.editor import ImageClip
 
-    clip_start_ms = int(clip_start * 1000)
-    clip_end_ms = int(clip_end * 1000)
-
-    relevant_words = []
-    for word_data in transcript_data['words']:
-        word_start = int(word_data.get('start', 0))
-        word_end = int(word_data.get('end', 0))
-        if word_start < clip_end_ms and word_end > clip_start_ms:
-            relative_start = max(0, (word_start - clip_start_ms) / 1000.0)
-            relative_end = min((clip_end_ms - clip_start_ms) / 1000.0, (word_end - clip_start_ms) / 1000.0)
-            if relative_end > relative_start:
-                relevant_words.append({
-                    'text': word_data.get('text', ''),
-                    'start': relative_start,
-                    'end': relative_end,
-                    'confidence': word_data.get('confidence', 1.0)
-                })
-
-    if not relevant_words:
-        logger.warning("No words found in clip timerange")
+    groups = _subtitle_groups(video_path, clip_start, clip_end)
+    if not groups:
         return []
 
     subtitle_clips = []
-    processor = VideoProcessor(font_family, font_size, font_color)
     
     # Use available fonts - DejaVu is confirmed to be available
-    font_arg = "DejaVu-Sans"  # This font is available and works with ImageMagick
-    
-    # --- Increased font sizing: 1.5× multiplier, min 28, max 64 ---
-    scale_multiplier = 1.5
-    calculated_font_size = int(font_size * (video_width / 720) * scale_multiplier)
-    final_font_size = max(28, min(64, calculated_font_size))
-    # ----------------------------------------------------------------
+    font_arg = "DejaVu-Sans"
+    final_font_size = _subtitle_font_size(font_size, video_width)
 
-    words_per_subtitle = 3
-    
-    # FIX: Add the missing code block that builds the subtitle text
-    for i in range(0, len(relevant_words), words_per_subtitle):
-        word_group = relevant_words[i:i + words_per_subtitle]
-        if not word_group:
-            continue
-            
-        # Build the text for this subtitle
-        text = ' '.join([word['text'] for word in word_group])
-        
-        # Calculate timing for this subtitle
-        segment_start = word_group[0]['start']
-        segment_end = word_group[-1]['end']
+    for text, segment_start, segment_end in groups:
         segment_duration = segment_end - segment_start
-        
-        if segment_duration <= 0:
-            continue
-            
         try:
-            # Attempt TextClip with 'label' method; fall back to 'caption' on failure
-            try:
-                text_clip = TextClip(
-                    txt=text,
-                    fontsize=final_font_size,
-                    font=font_arg,
-                    color=font_color,
-                    method='label'
-                ).set_duration(segment_duration).set_start(segment_start)
-            except Exception as e_label:
-                logger.debug("TextClip 'label' method failed: %s. Trying 'caption'...", e_label)
-                text_clip = TextClip(
-                    txt=text,
-                    fontsize=final_font_size,
-                    font=font_arg,
-                    color=font_color,
-                    method='caption'
-                ).set_duration(segment_duration).set_start(segment_start)
+            # Pillow rasterizes in-process; no ImageMagick convert spawn per subtitle
+            text_image = make_text_image(text, font_arg, final_font_size, font_color)
+            if text_image is None:
+                logger.warning("No Pillow font available; skipping subtitles")
+                return []
+            # RGBA input gives the clip an alpha mask (transparent background)
+            text_clip = ImageClip(text_image).set_duration(segment_duration).set_start(segment_start)
 
             if text_clip is not None:
                 text_height = text_clip.size[1] if getattr(text_clip, "size", None) else int(final_font_size * 1.6)
@@ -694,7 +1178,116 @@ def create_whisper_subtitles(
     return subtitle_clips
 
 
-# Clip creation - uses moviepy, lazy-imported
+# ASS subtitles burned in by ffmpeg's libass (system font name, not ImageMagick's)
+SUBTITLE_ASS_FONT = "DejaVu Sans"
+# Same sigma cv2.GaussianBlur derives for the MoviePy backdrop's 35px kernel;
+# ffmpeg's gblur is a recursive (IIR) Gaussian, so its cost doesn't grow with sigma
+BACKGROUND_BLUR_SIGMA = 5.6
+# 9:16 output canvas; the face-centred square fills its width, vertically centred
+CLIP_CANVAS_WIDTH = 1080
+CLIP_CANVAS_HEIGHT = 1920
+CLIP_SQUARE_SIZE = CLIP_CANVAS_WIDTH
+CLIP_SQUARE_Y = (CLIP_CANVAS_HEIGHT - CLIP_SQUARE_SIZE) // 2
+
+def _ass_time(seconds: float) -> str:
+    centiseconds = int(round(seconds * 100))
+    hours, rem = divmod(centiseconds, 360000)
+    minutes, rem = divmod(rem, 6000)
+    secs, centiseconds = divmod(rem, 100)
+    return f"{hours}:{minutes:02d}:{secs:02d}.{centiseconds:02d}"
+
+def _ass_color(color: str) -> str:
+    """Convert "#RRGGBB" (or a Pillow colour name) to ASS &HAABBGGRR; defaults to white."""
+    try:
+        hex_color = color.lstrip("#")
+        if len(hex_color) == 6:
+            r, g, b = (int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
+        else:
+            from PIL import ImageColor
+            r, g, b = ImageColor.getrgb(color)[:3]
+    except Exception:
+        r, g, b = 255, 255, 255
+    return f"&H00{b:02X}{g:02X}{r:02X}"
+
+def _escape_filter_value(value: Any) -> str:
+    """Quote a path for use as an ffmpeg filtergraph option value."""
+    return "'" + str(value).replace("\\", "/").replace("'", "'\\''") + "'"
+
+def _write_ass_subtitles(
+    video_path: Path,
+    clip_start: float,
+    clip_end: float,
+    video_width: int,
+    video_height: int,
+    font_size: int,
+    font_color: str,
+    square_y_position: int = None,
+    square_size: int = None
+) -> Optional[Path]:
+    """Write the clip's Whisper subtitles to a temporary .ass file, or return None if there are none."""
+    groups = _subtitle_groups(video_path, clip_start, clip_end)
+    if not groups:
+        return None
+
+    if square_y_position is not None and square_size is not None:
+        # Bottom of the square with 80px padding, same as the MoviePy layout
+        vertical_position = square_y_position + square_size - 80
+    else:
+        vertical_position = int(video_height * 0.85)
+
+    lines = [
+        "[Script Info]",
+        "ScriptType: v4.00+",
+        f"PlayResX: {video_width}",
+        f"PlayResY: {video_height}",
+        "WrapStyle: 2",
+        "",
+        "[V4+ Styles]",
+        "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, "
+        "Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, "
+        "Alignment, MarginL, MarginR, MarginV, Encoding",
+        # Alignment 8 = top-centre, so MarginV is the text's top edge
+        f"Style: Default,{SUBTITLE_ASS_FONT},{_subtitle_font_size(font_size, video_width)},{_ass_color(font_color)},"
+        f"&H000000FF,&H00000000,&H00000000,0,0,0,0,100,100,0,0,1,0,0,8,0,0,{vertical_position},1",
+        "",
+        "[Events]",
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
+    ]
+    for text, start, end in groups:
+        text = text.replace("{", "(").replace("}", ")").replace("\n", " ")
+        lines.append(f"Dialogue: 0,{_ass_time(start)},{_ass_time(end)},Default,,0,0,0,,{text}")
+
+    fd, subtitle_path = tempfile.mkstemp(prefix="clip_subs_", suffix=".ass")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    logger.info("Wrote %d subtitle events to %s", len(groups), subtitle_path)
+    return Path(subtitle_path)
+
+def _vertical_clip_filters(source: str, crop_region: Tuple[int, int, int, int], subtitle_path: Optional[Path], tag: str = "") -> str:
+    """
+    Filter chain laying the `source` pad out as a 9:16 clip: blurred full-frame
+    backdrop, face-centred square on top, and the ASS subtitles if given. The
+    chain is left open for the caller to extend and label; `tag` keeps the
+    internal labels unique when several chains share one filtergraph.
+    """
+    x_offset, y_offset, square_width, square_height = crop_region
+    chain = (
+        f"{source}split=2[bg{tag}][fg{tag}];"
+        # Blur the backdrop at 1/BLUR_DOWNSCALE_FACTOR size, then upscale: same look, far fewer pixels
+        f"[bg{tag}]scale={CLIP_CANVAS_WIDTH // BLUR_DOWNSCALE_FACTOR}:{CLIP_CANVAS_HEIGHT // BLUR_DOWNSCALE_FACTOR},setsar=1,"
+        f"gblur=sigma={BACKGROUND_BLUR_SIGMA / BLUR_DOWNSCALE_FACTOR:.2f},"
+        f"scale={CLIP_CANVAS_WIDTH}:{CLIP_CANVAS_HEIGHT}:flags=bilinear,setsar=1[bgb{tag}];"
+        f"[fg{tag}]crop={square_width}:{square_height}:{x_offset}:{y_offset},"
+        f"scale={CLIP_SQUARE_SIZE}:{CLIP_SQUARE_SIZE},setsar=1[sq{tag}];"
+        f"[bgb{tag}][sq{tag}]overlay=(W-w)/2:{CLIP_SQUARE_Y}"
+    )
+    if subtitle_path is not None:
+        chain += f"[base{tag}];[base{tag}]subtitles=filename={_escape_filter_value(subtitle_path)}"
+        fonts_dir = Path(__file__).parent.parent / "fonts"
+        if fonts_dir.exists():
+            chain += f":fontsdir={_escape_filter_value(fonts_dir)}"
+    return chain
+
 def create_optimized_clip(
     video_path: Path,
     start_time: float,
@@ -703,12 +1296,191 @@ def create_optimized_clip(
     add_subtitles: bool = True,
     font_family: str = "DejaVu-Sans",
     font_size: int = 24,
-    font_color: str = "#FFFFFF"
+    font_color: str = "#FFFFFF",
+    crop_region: Optional[Tuple[int, int, int, int]] = None
 ) -> bool:
+    """
+    Render a 9:16 clip in one ffmpeg pass: blurred full-frame backdrop, the
+    face-centred square on top, and Whisper subtitles burned in through libass.
+    Falls back to the MoviePy compositor if ffmpeg is missing or the
+    filtergraph fails (e.g. an ffmpeg build without libass). A precomputed
+    crop_region (x, y, w, h) skips opening the video for face detection.
+    """
     video_path = Path(video_path)
-    VideoFileClip, CompositeVideoClip, TextClip, concatenate_videoclips = _import_moviepy()
+    ffmpeg = _check_executable_in_path("ffmpeg")
+    if not ffmpeg:
+        return _create_optimized_clip_moviepy(
+            video_path, start_time, end_time, output_path, add_subtitles, font_family, font_size, font_color, crop_region
+        )
+
     video = None
-    clip = None
+    subtitle_path = None
+    try:
+        duration = end_time - start_time
+        if duration <= 0:
+            logger.error("Invalid clip duration: %.1f", duration)
+            return False
+
+        if crop_region is None:
+            # MoviePy only probes the file and feeds face detection; ffmpeg does the rendering,
+            # so with a precomputed crop MoviePy isn't even imported
+            VideoFileClip, CompositeVideoClip, TextClip, concatenate_videoclips = _import_moviepy()
+            video = VideoFileClip(str(video_path), audio=False)
+            if start_time >= video.duration:
+                logger.error("Start time %.1f exceeds video duration %.1f", start_time, video.duration)
+                return False
+
+            end_time = min(end_time, video.duration)
+            crop_region = detect_optimal_square_crop_region(video, start_time, end_time)
+            video.close()
+            video = None
+
+        if add_subtitles:
+            subtitle_path = _write_ass_subtitles(
+                video_path, start_time, end_time, CLIP_CANVAS_WIDTH, CLIP_CANVAS_HEIGHT,
+                font_size, font_color, CLIP_SQUARE_Y, CLIP_SQUARE_SIZE
+            )
+        filtergraph = _vertical_clip_filters("[0:v]", crop_region, subtitle_path)
+
+        processor = VideoProcessor(font_family, font_size, font_color)
+        encoding_settings = processor.get_optimal_encoding_settings("high")
+        if encoding_settings.get("video_filter"):
+            filtergraph += f",{encoding_settings['video_filter']}"
+        filtergraph += "[v]"
+        cmd = [
+            ffmpeg, "-hide_banner", "-v", "error", "-y",
+            *_hwaccel_input_args(),
+            "-ss", f"{start_time:.3f}", "-i", str(video_path), "-t", f"{end_time - start_time:.3f}",
+            "-filter_complex", filtergraph,
+            "-map", "[v]", "-map", "0:a:0?",
+            *_ffmpeg_encode_args(encoding_settings),
+            str(output_path),
+        ]
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        if result.returncode != 0:
+            logger.warning("ffmpeg clip render failed, falling back to MoviePy: %s", result.stderr.strip()[-500:])
+            return _create_optimized_clip_moviepy(
+                video_path, start_time, end_time, output_path, add_subtitles, font_family, font_size, font_color, crop_region
+            )
+
+        logger.info("Successfully created clip: %s", output_path)
+        return True
+
+    except Exception as e:
+        logger.exception("Failed to create clip: %s", e)
+        return False
+
+    finally:
+        try:
+            if video is not None:
+                video.close()
+        except Exception:
+            pass
+        try:
+            if subtitle_path is not None and subtitle_path.exists():
+                os.remove(subtitle_path)
+        except Exception:
+            pass
+
+def _composite_vertical_clip(background, square, square_y_position: int, overlay_clips: List[Any], size: Tuple[int, int]):
+    """
+    Composite backdrop, square video and static overlays (subtitles) into one
+    VideoClip with a single frame callback, instead of CompositeVideoClip
+    blitting every layer through MoviePy. The opaque square is pasted with a
+    numpy slice; overlays are rasterized once and pasted with PIL using their
+    alpha masks. Returns None if Pillow is unavailable.
+    """
+    try:
+        from PIL import Image
+        from moviepy.editor import VideoClip
+    except Exception:
+        return None
+
+    canvas_width, canvas_height = size
+    square_height, square_width = square.h, square.w
+    square_x = (canvas_width - square_width) // 2
+
+    # (start, end, rgb image, (x, y), alpha mask) per overlay
+    layers = []
+    for overlay in overlay_clips:
+        rgb = Image.fromarray(np.asarray(overlay.get_frame(0), dtype=np.uint8))
+        mask = None
+        if overlay.mask is not None:
+            mask = Image.fromarray((np.asarray(overlay.mask.get_frame(0)) * 255).astype(np.uint8), "L")
+        x, y = overlay.pos(0)
+        if x == 'center':
+            x = (canvas_width - rgb.width) // 2
+        if y == 'center':
+            y = (canvas_height - rgb.height) // 2
+        end = overlay.end if overlay.end is not None else float("inf")
+        layers.append((overlay.start, end, rgb, (int(x), int(y)), mask))
+
+    def make_frame(t):
+        frame = np.array(background.get_frame(t), dtype=np.uint8)
+        frame[square_y_position:square_y_position + square_height, square_x:square_x + square_width] = square.get_frame(t)
+        active = [layer for layer in layers if layer[0] <= t < layer[1]]
+        if not active:
+            return frame
+        canvas = Image.fromarray(frame)
+        for _, _, rgb, position, mask in active:
+            canvas.paste(rgb, position, mask)
+        return np.asarray(canvas)
+
+    composite = VideoClip(make_frame, duration=square.duration).set_fps(square.fps)
+    return composite.set_audio(square.audio)
+
+# Clip creation - uses moviepy, lazy-imported
+def _create_optimized_clip_moviepy(
+    video_path: Path,
+    start_time: float,
+    end_time: float,
+    output_path: Path,
+    add_subtitles: bool = True,
+    font_family: str = "DejaVu-Sans",
+    font_size: int = 24,
+    font_color: str = "#FFFFFF",
+    crop_region: Optional[Tuple[int, int, int, int]] = None
+) -> bool:
+    """One-shot MoviePy render: open the source, build the clip, close the source."""
+    video_path = Path(video_path)
+    VideoFileClip, CompositeVideoClip, TextClip, concatenate_videoclips = _import_moviepy()
+    if end_time - start_time <= 0:
+        logger.error("Invalid clip duration: %.1f", end_time - start_time)
+        return False
+    try:
+        video = VideoFileClip(str(video_path))
+    except Exception as e:
+        logger.exception("Failed to create clip: %s", e)
+        return False
+    try:
+        return _build_clip_from_opened(
+            video, video_path, start_time, end_time, output_path, add_subtitles, font_family, font_size, font_color, crop_region
+        )
+    finally:
+        try:
+            video.close()
+        except Exception:
+            pass
+
+def _build_clip_from_opened(
+    video,
+    video_path: Path,
+    start_time: float,
+    end_time: float,
+    output_path: Path,
+    add_subtitles: bool = True,
+    font_family: str = "DejaVu-Sans",
+    font_size: int = 24,
+    font_color: str = "#FFFFFF",
+    crop_region: Optional[Tuple[int, int, int, int]] = None
+) -> bool:
+    """
+    Render a 9:16 clip with MoviePy from an already-opened VideoFileClip.
+    The caller owns `video`; subclips share its reader, so only the derived
+    composite is closed here.
+    """
+    video_path = Path(video_path)
+    VideoFileClip, CompositeVideoClip, TextClip, concatenate_videoclips = _import_moviepy()
     final_clip = None
     temp_audio = None
     try:
@@ -717,10 +1489,8 @@ def create_optimized_clip(
             logger.error("Invalid clip duration: %.1f", duration)
             return False
 
-        video = VideoFileClip(str(video_path))
         if start_time >= video.duration:
             logger.error("Start time %.1f exceeds video duration %.1f", start_time, video.duration)
-            video.close()
             return False
 
         end_time = min(end_time, video.duration)
@@ -731,7 +1501,7 @@ def create_optimized_clip(
         target_height = 1920
         
         # Step 1: Crop to square (1:1) aspect ratio, centered on faces
-        x_offset, y_offset, square_width, square_height = detect_optimal_square_crop_region(video, start_time, end_time)
+        x_offset, y_offset, square_width, square_height = crop_region or detect_optimal_square_crop_region(video, start_time, end_time)
         square_clip = clip.crop(x1=x_offset, y1=y_offset, x2=x_offset + square_width, y2=y_offset + square_height)
         
         # Step 2: Resize square clip to fit within the vertical canvas
@@ -740,10 +1510,11 @@ def create_optimized_clip(
         square_clip_resized = square_clip.resize((square_size, square_size))
         
         # Step 3: Create blurred background from original clip
-        # Resize original clip to fill the entire 9:16 canvas
-        background_clip = clip.resize((target_width, target_height))
+        # Shrink to 1/BLUR_DOWNSCALE_FACTOR of the 9:16 canvas, blur there (a 7px kernel
+        # is the 35px full-size blur at that scale), then stretch back to fill the canvas
+        background_clip = clip.resize((target_width // BLUR_DOWNSCALE_FACTOR, target_height // BLUR_DOWNSCALE_FACTOR))
         # Apply blur effect and remove audio (background should be silent)
-        blurred_background = apply_gaussian_blur(background_clip, ksize=35).without_audio()
+        blurred_background = apply_gaussian_blur(background_clip, ksize=7).resize((target_width, target_height)).without_audio()
         
         # Step 4: Position the square video in the center of the vertical canvas
         # Calculate vertical position to center the square
@@ -766,7 +1537,12 @@ def create_optimized_clip(
 
         # Create final composite clip with proper canvas size
         # Audio will come from square_clip_positioned (the main video)
-        final_clip = CompositeVideoClip(final_clips, size=(target_width, target_height))
+        final_clip = _composite_vertical_clip(
+            blurred_background, square_clip_resized, square_y_position,
+            final_clips[2:], (target_width, target_height)
+        )
+        if final_clip is None:
+            final_clip = CompositeVideoClip(final_clips, size=(target_width, target_height))
 
         tmpf = tempfile.NamedTemporaryFile(prefix="tmp_audio_", suffix=".m4a", delete=False)
         temp_audio = tmpf.name
@@ -785,7 +1561,7 @@ def create_optimized_clip(
             bitrate=encoding_settings.get("bitrate"),
             audio_bitrate=encoding_settings.get("audio_bitrate"),
             preset=encoding_settings.get("preset"),
-            ffmpeg_params=encoding_settings.get("ffmpeg_params", [])
+            ffmpeg_params=_writer_ffmpeg_params(encoding_settings)
         )
 
         logger.info("Successfully created clip: %s", output_path)
@@ -801,16 +1577,6 @@ def create_optimized_clip(
                 final_clip.close()
         except Exception:
             pass
-        try:
-            if clip is not None:
-                clip.close()
-        except Exception:
-            pass
-        try:
-            if video is not None:
-                video.close()
-        except Exception:
-            pass
         try:
             if temp_audio and Path(temp_audio).exists():
                 os.remove(temp_audio)
@@ -818,20 +1584,89 @@ def create_optimized_clip(
             pass
 
 # --- Clip creation and transitions ------------------------------------------------------
-def create_clips_from_segments(
-    video_path: Path, 
-    segments: List[Dict[str, Any]], 
-    output_dir: Path, 
-    font_family: str = "DejaVu-Sans", 
-    font_size: int = 24, 
-    font_color: str = "#FFFFFF"
-) -> List[Dict[str, Any]]:
-    """Create optimized video clips from segments."""
-    logger.info(f"Creating {len(segments)} clips")
-    
-    output_dir.mkdir(parents=True, exist_ok=True)
-    clips_info = []
-    
+def detect_crops_for_ranges(video_path: Path, ranges: List[Tuple[float, float]]) -> Dict[Tuple[float, float], Tuple[int, int, int, int]]:
+    """
+    Run square-crop face detection for several (start, end) ranges of one video,
+    opening it only once. Ranges that start past the end of the video are left
+    out so create_optimized_clip can report them itself.
+    """
+    crops: Dict[Tuple[float, float], Tuple[int, int, int, int]] = {}
+    if not ranges:
+        return crops
+    try:
+        VideoFileClip, CompositeVideoClip, TextClip, concatenate_videoclips = _import_moviepy()
+        video = VideoFileClip(str(video_path), audio=False)
+    except Exception as e:
+        logger.warning("Crop precomputation unavailable for %s: %s", video_path, e)
+        return crops
+
+    try:
+        for start_time, end_time in ranges:
+            if start_time >= video.duration or (start_time, end_time) in crops:
+                continue
+            crops[(start_time, end_time)] = detect_optimal_square_crop_region(
+                video, start_time, min(end_time, video.duration)
+            )
+    finally:
+        video.close()
+    return crops
+
+# ffmpeg thread cap for clip renders; set in pool workers so parallel encodes share the CPU
+_CLIP_FFMPEG_THREADS: Optional[int] = None
+
+def _init_clip_worker(ffmpeg_threads: int) -> None:
+    global _CLIP_FFMPEG_THREADS
+    _CLIP_FFMPEG_THREADS = ffmpeg_threads
+
+def _render_clips_from_one_source(clip_args: List[tuple]) -> List[bool]:
+    """Serial MoviePy renders of one source video, opened once and subclipped per segment."""
+    VideoFileClip, CompositeVideoClip, TextClip, concatenate_videoclips = _import_moviepy()
+    video_path = Path(clip_args[0][0])
+    try:
+        video = VideoFileClip(str(video_path))
+    except Exception as e:
+        logger.error("Failed to open %s: %s", video_path, e)
+        return [False] * len(clip_args)
+    with video:
+        return [_build_clip_from_opened(video, *args) for args in clip_args]
+
+def _render_clips(clip_args: List[tuple], render=None) -> List[bool]:
+    """Run `render` (create_optimized_clip by default) for each argument tuple, in worker processes when configured.
+
+    Only paths, times and font settings cross the process boundary; each worker
+    opens the video itself and lazily builds its own model/detector caches.
+    """
+    render = render or create_optimized_clip
+    workers = min(len(clip_args), config.clip_workers)
+    if workers <= 1:
+        if (render is create_optimized_clip and not _check_executable_in_path("ffmpeg")
+                and len({Path(args[0]) for args in clip_args}) == 1):
+            return _render_clips_from_one_source(clip_args)
+        return [render(*args) for args in clip_args]
+
+    # Split the cores between workers so concurrent ffmpeg encodes don't oversubscribe
+    threads_per_clip = max(1, (os.cpu_count() or workers) // workers)
+    logger.info("Rendering %d clips with %d worker processes (%d ffmpeg threads each)", len(clip_args), workers, threads_per_clip)
+    results = []
+    # spawn rather than fork: the API process has live threads (event loop, log listeners)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_clip_worker,
+        initargs=(threads_per_clip,)
+    ) as pool:
+        futures = [pool.submit(render, *args) for args in clip_args]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error("Clip worker failed: %s", e)
+                results.append(False)
+    return results
+
+def _plan_clip_jobs(segments: List[Dict[str, Any]], output_dir: Path) -> List[tuple]:
+    """Validate segments into (index, segment, start, end, duration, filename, path) render jobs."""
+    jobs = []
     for i, segment in enumerate(segments):
         try:
             logger.info(f"Processing segment {i+1}: start='{segment.get('start_time')}', end='{segment.get('end_time')}'")
@@ -848,22 +1683,58 @@ def create_clips_from_segments(
             
             clip_filename = f"clip_{i+1}_{segment['start_time'].replace(':', '')}-{segment['end_time'].replace(':', '')}.mp4"
             clip_path = output_dir / clip_filename
-            
-            success = create_optimized_clip(video_path, start_seconds, end_seconds, clip_path, True, font_family, font_size, font_color)
-            
+            jobs.append((i, segment, start_seconds, end_seconds, duration, clip_filename, clip_path))
+                
+        except Exception as e:
+            logger.error(f"Error processing clip {i+1}: {e}")
+    return jobs
+
+def _clip_info(job: tuple, filename: str = None, path: Path = None) -> Dict[str, Any]:
+    """clips_info entry for a rendered job, optionally pointing at a different output file."""
+    i, segment, _, _, duration, clip_filename, clip_path = job
+    return {
+        "clip_id": i + 1,
+        "filename": filename or clip_filename,
+        "path": str(path or clip_path),
+        "start_time": segment['start_time'],
+        "end_time": segment['end_time'],
+        "duration": duration,
+        "text": segment['text'],
+        "relevance_score": segment['relevance_score'],
+        "reasoning": segment['reasoning']
+    }
+
+def create_clips_from_segments(
+    video_path: Path, 
+    segments: List[Dict[str, Any]], 
+    output_dir: Path, 
+    font_family: str = "DejaVu-Sans", 
+    font_size: int = 24, 
+    font_color: str = "#FFFFFF"
+) -> List[Dict[str, Any]]:
+    """Create optimized video clips from segments."""
+    logger.info(f"Creating {len(segments)} clips")
+    
+    output_dir.mkdir(parents=True, exist_ok=True)
+    clips_info = []
+    
+    # Validate every segment up front, then render the clips (possibly in parallel)
+    jobs = _plan_clip_jobs(segments, output_dir)
+
+    # Face detection for every segment in one pass over the source, before fanning out
+    crops = detect_crops_for_ranges(video_path, [(job[2], job[3]) for job in jobs])
+
+    results = _render_clips([
+        (video_path, start_seconds, end_seconds, clip_path, True, font_family, font_size, font_color,
+         crops.get((start_seconds, end_seconds)))
+        for (_, _, start_seconds, end_seconds, _, _, clip_path) in jobs
+    ])
+
+    for job, success in zip(jobs, results):
+        i, duration = job[0], job[4]
+        try:
             if success:
-                clip_info = {
-                    "clip_id": i + 1,
-                    "filename": clip_filename,
-                    "path": str(clip_path),
-                    "start_time": segment['start_time'],
-                    "end_time": segment['end_time'],
-                    "duration": duration,
-                    "text": segment['text'],
-                    "relevance_score": segment['relevance_score'],
-                    "reasoning": segment['reasoning']
-                }
-                clips_info.append(clip_info)
+                clips_info.append(_clip_info(job))
                 logger.info(f"Created clip {i+1}: {duration:.1f}s")
             else:
                 logger.error(f"Failed to create clip {i+1}")
@@ -888,7 +1759,119 @@ def get_available_transitions() -> List[str]:
     logger.info(f"Found {len(transition_files)} transition files")
     return transition_files
 
+# Crossfade length at each side of a transition clip, and the longest transition used
+TRANSITION_FADE_SECONDS = 0.5
+TRANSITION_MAX_SECONDS = 1.5
+
+def _probe_media(path: Path) -> Optional[Dict[str, Any]]:
+    """Duration, first video stream geometry/frame rate and audio presence via ffprobe, or None."""
+    ffprobe = _check_executable_in_path("ffprobe")
+    if not ffprobe:
+        return None
+    try:
+        result = subprocess.run(
+            [ffprobe, "-v", "error", "-show_entries",
+             "format=duration:stream=codec_type,width,height,avg_frame_rate", "-of", "json", str(path)],
+            capture_output=True, timeout=30
+        )
+        if result.returncode != 0:
+            logger.debug("ffprobe failed for %s: %s", path, result.stderr.decode(errors="replace").strip())
+            return None
+        info = _load_json_bytes(result.stdout)
+        streams = info.get("streams", [])
+        video = next((st for st in streams if st.get("codec_type") == "video"), None)
+        if video is None:
+            return None
+        fps = video.get("avg_frame_rate") or "0/0"
+        return {
+            "duration": float(info["format"]["duration"]),
+            "width": int(video["width"]),
+            "height": int(video["height"]),
+            "fps": fps if fps != "0/0" else "30/1",
+            "has_audio": any(st.get("codec_type") == "audio" for st in streams),
+        }
+    except Exception as e:
+        logger.debug("ffprobe failed for %s: %s", path, e)
+        return None
+
+def _xfade_filtergraph(
+    inputs: List[Dict[str, Any]], width: int, height: int, fps: str, fade: float, video_filter: Optional[str] = None
+) -> str:
+    """
+    Filtergraph chaining every input into [v]/[a] with xfade/acrossfade.
+    Each input dict carries its "video" and "audio" pad labels (audio None when
+    the input has no audio stream) and its "duration"; inputs are conformed to
+    one size, frame rate and sample format first, and missing audio is filled
+    with silence so the audio chain stays aligned.
+    video_filter (e.g. a hardware upload) is applied to the final [v].
+    """
+    parts = []
+    for n, item in enumerate(inputs):
+        duration = item["duration"]
+        parts.append(
+            f"{item['video']}trim=duration={duration:.3f},setpts=PTS-STARTPTS,fps={fps},"
+            f"scale={width}:{height},setsar=1,format=yuv420p,settb=AVTB[v{n}]"
+        )
+        # apad + atrim makes every audio piece exactly as long as its video
+        audio_source = f"{item['audio']}apad," if item["audio"] else "anullsrc=r=44100:cl=stereo,"
+        parts.append(
+            f"{audio_source}atrim=duration={duration:.3f},asetpts=PTS-STARTPTS,"
+            f"aformat=sample_rates=44100:channel_layouts=stereo[a{n}]"
+        )
+
+    video_label, audio_label = "[v0]", "[a0]"
+    timeline = inputs[0]["duration"]
+    for n in range(1, len(inputs)):
+        last = n == len(inputs) - 1
+        video_out = "[v]" if last else f"[vx{n}]"
+        audio_out = "[a]" if last else f"[ax{n}]"
+        tail = f",{video_filter}" if last and video_filter else ""
+        parts.append(f"{video_label}[v{n}]xfade=transition=fade:duration={fade:.3f}:offset={timeline - fade:.3f}{tail}{video_out}")
+        parts.append(f"{audio_label}[a{n}]acrossfade=d={fade:.3f}{audio_out}")
+        video_label, audio_label = video_out, audio_out
+        timeline += inputs[n]["duration"] - fade
+    return ";".join(parts)
+
 def apply_transition_effect(clip1_path: Path, clip2_path: Path, transition_path: Path, output_path: Path) -> bool:
+    """
+    Join two clips through a transition video in one ffmpeg xfade/acrossfade
+    pass: clip1 fades into the transition, which fades into clip2. Falls back
+    to MoviePy when ffmpeg/ffprobe are missing or the filtergraph fails.
+    """
+    ffmpeg = _check_executable_in_path("ffmpeg")
+    probes = [_probe_media(path) for path in (clip1_path, transition_path, clip2_path)] if ffmpeg else []
+    if not ffmpeg or not all(probes):
+        return _apply_transition_effect_moviepy(clip1_path, clip2_path, transition_path, output_path)
+
+    clip1_info, transition_info, clip2_info = probes
+    durations = [clip1_info["duration"], min(TRANSITION_MAX_SECONDS, transition_info["duration"]), clip2_info["duration"]]
+    # A crossfade can't be longer than half of any piece it blends
+    fade = min(TRANSITION_FADE_SECONDS, min(durations) / 2)
+    inputs = [
+        {"video": f"[{i}:v]", "audio": f"[{i}:a]" if info["has_audio"] else None, "duration": duration}
+        for i, (duration, info) in enumerate(zip(durations, probes))
+    ]
+    encoding_settings = VideoProcessor().get_optimal_encoding_settings("high")
+    filtergraph = _xfade_filtergraph(
+        inputs, clip1_info["width"], clip1_info["height"], clip1_info["fps"], fade, encoding_settings.get("video_filter")
+    )
+    cmd = [
+        ffmpeg, "-hide_banner", "-v", "error", "-y",
+        "-i", str(clip1_path), "-i", str(transition_path), "-i", str(clip2_path),
+        "-filter_complex", filtergraph,
+        "-map", "[v]", "-map", "[a]",
+        *_ffmpeg_encode_args(encoding_settings),
+        str(output_path),
+    ]
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    if result.returncode != 0:
+        logger.warning("ffmpeg transition failed (%s); falling back to MoviePy", result.stderr.strip()[-500:])
+        return _apply_transition_effect_moviepy(clip1_path, clip2_path, transition_path, output_path)
+
+    logger.info("Applied transition effect: %s", output_path)
+    return True
+
+def _apply_transition_effect_moviepy(clip1_path: Path, clip2_path: Path, transition_path: Path, output_path: Path) -> bool:
     """Apply transition effect between two clips using a transition video."""
     VideoFileClip, CompositeVideoClip, TextClip, concatenate_videoclips = _import_moviepy()
     
@@ -932,7 +1915,7 @@ def apply_transition_effect(clip1_path: Path, clip2_path: Path, transition_path:
             bitrate=encoding_settings.get("bitrate"),
             audio_bitrate=encoding_settings.get("audio_bitrate"),
             preset=encoding_settings.get("preset"),
-            ffmpeg_params=encoding_settings.get("ffmpeg_params", [])
+            ffmpeg_params=_writer_ffmpeg_params(encoding_settings)
         )
         
         # Cleanup
@@ -948,7 +1931,7 @@ def apply_transition_effect(clip1_path: Path, clip2_path: Path, transition_path:
         logger.error(f"Error applying transition effect: {e}")
         return False
 
-def create_clips_with_transitions(
+def _create_clips_with_transitions_two_pass(
     video_path: Path, 
     segments: List[Dict[str, Any]], 
     output_dir: Path, 
@@ -956,7 +1939,7 @@ def create_clips_with_transitions(
     font_size: int = 24, 
     font_color: str = "#FFFFFF"
 ) -> List[Dict[str, Any]]:
-    """Create video clips with transition effects between them."""
+    """Render every clip, then re-encode consecutive pairs through apply_transition_effect (MoviePy-capable fallback)."""
     logger.info(f"Creating {len(segments)} clips with transitions")
     
     # First create individual clips
@@ -1017,14 +2000,176 @@ def create_clips_with_transitions(
     logger.info(f"Successfully created {len(enhanced_clips)} clips with transitions")
     return enhanced_clips
 
+def render_transition_clip(
+    video_path: Path,
+    prev_range: Tuple[float, float],
+    current_range: Tuple[float, float],
+    transition_path: Path,
+    output_path: Path,
+    font_family: str = "DejaVu-Sans",
+    font_size: int = 24,
+    font_color: str = "#FFFFFF",
+    prev_crop: Optional[Tuple[int, int, int, int]] = None,
+    current_crop: Optional[Tuple[int, int, int, int]] = None
+) -> bool:
+    """
+    Render "previous segment -> transition -> current segment" straight from the
+    source in one ffmpeg pass: both segments get the 9:16 layout and subtitles
+    of create_optimized_clip and are crossfaded through the transition, with a
+    single encode. Returns False, leaving the fallback to the caller, when
+    ffmpeg/ffprobe or a crop is missing or the filtergraph fails.
+    """
+    video_path = Path(video_path)
+    ffmpeg = _check_executable_in_path("ffmpeg")
+    if not ffmpeg or prev_crop is None or current_crop is None:
+        return False
+    source_info = _probe_media(video_path)
+    transition_info = _probe_media(transition_path)
+    if not source_info or not transition_info:
+        return False
+
+    ranges = [(start, min(end, source_info["duration"])) for start, end in (prev_range, current_range)]
+    if any(end <= start for start, end in ranges):
+        return False
+    durations = [
+        ranges[0][1] - ranges[0][0],
+        min(TRANSITION_MAX_SECONDS, transition_info["duration"]),
+        ranges[1][1] - ranges[1][0],
+    ]
+    fade = min(TRANSITION_FADE_SECONDS, min(durations) / 2)
+    source_audio = source_info["has_audio"]
+
+    subtitle_paths: List[Optional[Path]] = []
+    try:
+        for start, end in ranges:
+            subtitle_paths.append(_write_ass_subtitles(
+                video_path, start, end, CLIP_CANVAS_WIDTH, CLIP_CANVAS_HEIGHT,
+                font_size, font_color, CLIP_SQUARE_Y, CLIP_SQUARE_SIZE
+            ))
+
+        encoding_settings = VideoProcessor(font_family, font_size, font_color).get_optimal_encoding_settings("high")
+        filtergraph = ";".join([
+            _vertical_clip_filters("[0:v]", prev_crop, subtitle_paths[0], tag="0") + "[c0]",
+            _vertical_clip_filters("[2:v]", current_crop, subtitle_paths[1], tag="2") + "[c2]",
+            _xfade_filtergraph(
+                [
+                    {"video": "[c0]", "audio": "[0:a]" if source_audio else None, "duration": durations[0]},
+                    {"video": "[1:v]", "audio": "[1:a]" if transition_info["has_audio"] else None, "duration": durations[1]},
+                    {"video": "[c2]", "audio": "[2:a]" if source_audio else None, "duration": durations[2]},
+                ],
+                CLIP_CANVAS_WIDTH, CLIP_CANVAS_HEIGHT, source_info["fps"], fade, encoding_settings.get("video_filter")
+            ),
+        ])
+        cmd = [
+            ffmpeg, "-hide_banner", "-v", "error", "-y",
+            *_hwaccel_input_args(), "-ss", f"{ranges[0][0]:.3f}", "-t", f"{durations[0]:.3f}", "-i", str(video_path),
+            "-i", str(transition_path),
+            *_hwaccel_input_args(), "-ss", f"{ranges[1][0]:.3f}", "-t", f"{durations[2]:.3f}", "-i", str(video_path),
+            "-filter_complex", filtergraph,
+            "-map", "[v]", "-map", "[a]",
+            *_ffmpeg_encode_args(encoding_settings),
+            str(output_path),
+        ]
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        if result.returncode != 0:
+            logger.warning("ffmpeg transition clip render failed: %s", result.stderr.strip()[-500:])
+            return False
+
+        logger.info("Rendered transition clip: %s", output_path)
+        return True
+
+    except Exception as e:
+        logger.warning("Transition clip render failed: %s", e)
+        return False
+
+    finally:
+        for subtitle_path in subtitle_paths:
+            try:
+                if subtitle_path is not None and subtitle_path.exists():
+                    os.remove(subtitle_path)
+            except Exception:
+                pass
+
+def create_clips_with_transitions(
+    video_path: Path, 
+    segments: List[Dict[str, Any]], 
+    output_dir: Path, 
+    font_family: str = "DejaVu-Sans", 
+    font_size: int = 24, 
+    font_color: str = "#FFFFFF"
+) -> List[Dict[str, Any]]:
+    """
+    Create video clips with transition effects between them.
+
+    The first clip is rendered on its own; every later clip is rendered once,
+    already joined to its predecessor through a transition, rather than being
+    encoded standalone and then re-encoded pairwise. Without ffmpeg/ffprobe on
+    PATH the two-pass MoviePy-capable flow is used.
+    """
+    transitions = get_available_transitions() if len(segments) > 1 else []
+    if not transitions or not (_check_executable_in_path("ffmpeg") and _check_executable_in_path("ffprobe")):
+        return _create_clips_with_transitions_two_pass(video_path, segments, output_dir, font_family, font_size, font_color)
+
+    logger.info("Creating %d clips with transitions", len(segments))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    transition_output_dir = output_dir / "with_transitions"
+    transition_output_dir.mkdir(parents=True, exist_ok=True)
+
+    jobs = _plan_clip_jobs(segments, output_dir)
+    if not jobs:
+        return []
+    crops = detect_crops_for_ranges(video_path, [(job[2], job[3]) for job in jobs])
+
+    def standalone_args(job):
+        return (video_path, job[2], job[3], job[6], True, font_family, font_size, font_color, crops.get((job[2], job[3])))
+
+    first_ok = _render_clips([standalone_args(jobs[0])])[0]
+    pair_args = []
+    for k in range(1, len(jobs)):
+        prev, job = jobs[k - 1], jobs[k]
+        # Cycle through the available transitions
+        transition_path = Path(transitions[k % len(transitions)])
+        pair_args.append((
+            video_path, (prev[2], prev[3]), (job[2], job[3]), transition_path,
+            transition_output_dir / f"transition_{k}_{job[5]}", font_family, font_size, font_color,
+            crops.get((prev[2], prev[3])), crops.get((job[2], job[3]))
+        ))
+    pair_results = _render_clips(pair_args, render=render_transition_clip)
+
+    # Clips whose transition render failed fall back to a plain clip
+    failed = [k for k, ok in enumerate(pair_results, start=1) if not ok]
+    fallback_results = dict(zip(failed, _render_clips([standalone_args(jobs[k]) for k in failed]))) if failed else {}
+
+    clips_info = []
+    if first_ok:
+        clips_info.append(_clip_info(jobs[0]))
+    else:
+        logger.error("Failed to create clip %d", jobs[0][0] + 1)
+    for k, ok in enumerate(pair_results, start=1):
+        job = jobs[k]
+        if ok:
+            clip_info = _clip_info(job, f"transition_{k}_{job[5]}", pair_args[k - 1][4])
+            clip_info["has_transition"] = True
+            clips_info.append(clip_info)
+            logger.info("Added transition to clip %d", job[0] + 1)
+        elif fallback_results.get(k):
+            clips_info.append(_clip_info(job))
+            logger.warning("Failed to add transition to clip %d, using original", job[0] + 1)
+        else:
+            logger.error("Failed to create clip %d", job[0] + 1)
+
+    logger.info("Successfully created %d clips with transitions", len(clips_info))
+    return clips_info
+
 def split_video_by_duration(video_path: Path, duration_seconds: int, output_dir: Path):
     from moviepy.editor import VideoFileClip
 
     output_dir.mkdir(parents=True, exist_ok=True)
     clips_info = []
 
-    with VideoFileClip(str(video_path)) as probe:
-        total_duration = probe.duration
+    # One reader for the whole split instead of reopening the file per chunk
+    video = VideoFileClip(str(video_path))
+    total_duration = video.duration
 
     current_start = 0.0
     clip_count = 0
@@ -1046,15 +2191,14 @@ def split_video_by_duration(video_path: Path, duration_seconds: int, output_dir:
         )
 
         try:
-            video = VideoFileClip(str(video_path))
             clip = video.subclip(current_start, current_end)
 
             clip.write_videofile(
                 str(clip_path),
                 codec="libx264",
                 audio_codec="aac",
-                preset="medium",
-                ffmpeg_params=["-pix_fmt", "yuv420p"],
+                preset="veryfast",
+                ffmpeg_params=["-crf", "23", "-pix_fmt", "yuv420p", *X264_TUNING_PARAMS, *GOP_PARAMS, *FASTSTART_PARAMS],
                 logger=None,
                 verbose=False
             )
@@ -1074,22 +2218,30 @@ def split_video_by_duration(video_path: Path, duration_seconds: int, output_dir:
             logger.error(f"❌ Error creating clip {clip_count}: {e}")
 
         finally:
-            try:
-                clip.close()
-                video.close()
-            except Exception:
-                pass
+            # Subclips share the parent's readers, so only the parent is closed (below)
             current_start = current_end
 
+    video.close()
     return clips_info
 
+# Slack for the segment muxer to accept a forced keyframe at a boundary (~1 frame)
+SEGMENT_TIME_DELTA = 0.05
+
+def _snap_to_boundary(seconds: float, duration_seconds: float) -> float:
+    """Round a segment time onto the nearest multiple of duration_seconds when it's within SEGMENT_TIME_DELTA."""
+    boundary = round(seconds / duration_seconds) * duration_seconds
+    return float(boundary) if abs(seconds - boundary) <= SEGMENT_TIME_DELTA else seconds
+
 def split_video_by_duration_ffmpeg(
     video_path: Path,
     duration_seconds: int,
-    output_dir: Path
+    output_dir: Path,
+    reencode: bool = False
 ) -> List[Dict[str, Any]]:
     """
-    Split video using pure ffmpeg (safe for Colab / long videos)
+    Split video using pure ffmpeg (safe for Colab / long videos).
+    By default streams are copied, so cuts snap to keyframes; pass
+    reencode=True for frame-accurate (but much slower) libx264 cuts.
     """
     video_path = Path(video_path)
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -1115,65 +2267,93 @@ def split_video_by_duration_ffmpeg(
     total_duration = float(result.stdout.strip())
     logger.info(f"Video duration: {total_duration:.2f} seconds")
 
-    clips_info = []
-    clip_count = 0
-    current_start = 0.0
-
-    while current_start < total_duration:
-        clip_count += 1
-        current_end = min(current_start + duration_seconds, total_duration)
-        clip_duration = current_end - current_start
-
-        clip_filename = (
-            f"clip_{clip_count:04d}_"
-            f"{current_start:.1f}s-{current_end:.1f}s.mp4"
-        )
-        clip_path = output_dir / clip_filename
-
-        logger.info(
-            f"Creating clip {clip_count}: "
-            f"{current_start:.2f}s - {current_end:.2f}s"
-        )
-
-        ffmpeg_cmd = [
-            "ffmpeg",
-            "-y",
-            "-ss", f"{current_start}",
-            "-i", str(video_path),
-            "-t", f"{clip_duration}",
-            "-map", "0:v:0",
-            "-map", "0:a?",
-            "-c:v", "libx264",
-            "-preset", "medium",
-            "-crf", "20",
-            "-pix_fmt", "yuv420p",
+    # One ffmpeg pass with the segment muxer instead of a process (and seek) per chunk;
+    # the CSV segment list reports each chunk's actual start/end
+    segment_pattern = output_dir / "segment_%04d.mp4"
+    segment_list = output_dir / f".segments_{os.getpid()}.csv"
+    ffmpeg_cmd = [
+        "ffmpeg",
+        "-y",
+        # Stream copy never decodes, so hardware decode only matters when re-encoding
+        *(_hwaccel_input_args() if reencode else []),
+        "-i", str(video_path),
+        "-map", "0:v:0",
+        "-map", "0:a?",
+    ]
+    if reencode:
+        hw_encoder = _detect_hw_h264_encoder() if config.video_encoder == "auto" else None
+        if hw_encoder is not None:
+            ffmpeg_cmd += [*hw_encoder["params"], "-c:v", hw_encoder["codec"]]
+            if hw_encoder.get("video_filter"):
+                ffmpeg_cmd += ["-vf", hw_encoder["video_filter"]]
+        else:
+            ffmpeg_cmd += ["-c:v", "libx264", "-preset", "veryfast", "-crf", "23", "-pix_fmt", "yuv420p", *X264_TUNING_PARAMS]
+        ffmpeg_cmd += [
+            *GOP_PARAMS,
             "-c:a", "aac",
-            "-movflags", "+faststart",
-            str(clip_path)
+            # Keyframes exactly on the boundaries so segments are cut where requested
+            "-force_key_frames", f"expr:gte(t,n_forced*{duration_seconds})",
         ]
+    else:
+        ffmpeg_cmd += ["-c", "copy"]
+    ffmpeg_cmd += [
+        "-f", "segment",
+        "-segment_time", str(duration_seconds),
+        # The forced keyframe's timestamp lands just past each boundary after encoder
+        # delay; without slack the muxer skips it and cuts at the next GOP keyframe
+        *(["-segment_time_delta", str(SEGMENT_TIME_DELTA)] if reencode else []),
+        "-reset_timestamps", "1",
+        "-segment_list", str(segment_list),
+        "-segment_list_type", "csv",
+        "-segment_format_options", "movflags=+faststart",
+        str(segment_pattern)
+    ]
 
-        process = subprocess.run(
-            ffmpeg_cmd,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.PIPE,
-            text=True
-        )
+    logger.info("Splitting into ~%ss clips", duration_seconds)
+    process = subprocess.run(
+        ffmpeg_cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True
+    )
 
+    clips_info = []
+    try:
         if process.returncode != 0:
-            logger.error(
-                f"ffmpeg failed for clip {clip_count}: {process.stderr}"
+            logger.error("ffmpeg segmenting failed: %s", process.stderr)
+            return clips_info
+
+        with open(segment_list, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+
+        for clip_count, (segment_name, start, end) in enumerate(rows, start=1):
+            current_start = float(start)
+            current_end = float(end)
+            if reencode:
+                # Re-encoded cuts sit on the requested boundaries; report those rather
+                # than the keyframe timestamps shifted by encoder delay
+                current_start = _snap_to_boundary(current_start, duration_seconds)
+                current_end = min(total_duration, _snap_to_boundary(current_end, duration_seconds))
+            clip_filename = (
+                f"clip_{clip_count:04d}_"
+                f"{current_start:.1f}s-{current_end:.1f}s.mp4"
             )
-        else:
+            clip_path = output_dir / clip_filename
+            os.replace(output_dir / segment_name, clip_path)
+
             clips_info.append({
                 "clip_number": clip_count,
                 "filename": clip_filename,
                 "path": str(clip_path),
                 "start_time": current_start,
                 "end_time": current_end,
-                "duration": clip_duration
+                "duration": current_end - current_start
             })
             logger.info(f"✅ Created clip {clip_count}")
-
-        current_start = current_end
+    finally:
+        try:
+            segment_list.unlink()
+        except OSError:
+            pass
 
     return clips_info
\ No newline at end of file
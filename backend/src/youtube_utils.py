@@ -11,10 +11,21 @@ from pathlib import Path
 import logging
 import time
 
-from .config import Config
+from .config import get_config
 
 logger = logging.getLogger(__name__)
-config = Config()
+config = get_config()
+
+# Comprehensive regex patterns for different YouTube URL formats, compiled once
+_YOUTUBE_ID_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"(?:youtube\.com/(?:.*v=|v/|embed/|shorts/)|youtu\.be/)([A-Za-z0-9_-]{11})",
+    r"youtube\.com/watch\?v=([A-Za-z0-9_-]{11})",
+    r"youtube\.com/embed/([A-Za-z0-9_-]{11})",
+    r"youtube\.com/v/([A-Za-z0-9_-]{11})",
+    r"youtu\.be/([A-Za-z0-9_-]{11})",
+    r"youtube\.com/shorts/([A-Za-z0-9_-]{11})",
+    r"m\.youtube\.com/watch\?v=([A-Za-z0-9_-]{11})",
+))
 
 class YouTubeDownloader:
     """Enhanced YouTube downloader with optimized settings."""
@@ -93,19 +104,8 @@ def get_youtube_video_id(url: str) -> Optional[str]:
 
     url = url.strip()
 
-    # Comprehensive regex patterns for different YouTube URL formats
-    patterns = [
-        r"(?:youtube\.com/(?:.*v=|v/|embed/|shorts/)|youtu\.be/)([A-Za-z0-9_-]{11})",
-        r"youtube\.com/watch\?v=([A-Za-z0-9_-]{11})",
-        r"youtube\.com/embed/([A-Za-z0-9_-]{11})",
-        r"youtube\.com/v/([A-Za-z0-9_-]{11})",
-        r"youtu\.be/([A-Za-z0-9_-]{11})",
-        r"youtube\.com/shorts/([A-Za-z0-9_-]{11})",
-        r"m\.youtube\.com/watch\?v=([A-Za-z0-9_-]{11})",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url, re.IGNORECASE)
+    for pattern in _YOUTUBE_ID_PATTERNS:
+        match = pattern.search(url)
         if match:
             video_id = match.group(1)
             # Validate video ID length (YouTube IDs are always 11 characters)
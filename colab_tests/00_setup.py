@@ -6,6 +6,11 @@
 import subprocess
 import sys
 import os
+from importlib import metadata
+
+# Persistent wheel cache on Google Drive so runtime restarts skip re-downloads
+DRIVE_ROOT = "/content/drive/MyDrive"
+PIP_CACHE_DIR = os.path.join(DRIVE_ROOT, ".pip-cache")
 
 def install_dependencies():
     """Install required Python packages"""
@@ -27,15 +32,32 @@ def install_dependencies():
         "aiofiles"
     ]
     
+    # Skip packages that are already present (e.g. when the cell is re-run)
+    missing = []
     for package in packages:
         try:
-            print(f"Installing {package}...")
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-            print(f"✅ {package} installed successfully")
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to install {package}: {e}")
+            metadata.version(package)
+        except metadata.PackageNotFoundError:
+            missing.append(package)
+    if not missing:
+        print("✅ All packages already installed!")
+        return
+    packages = missing
+    
+    pip_cmd = [sys.executable, "-m", "pip", "install", "--disable-pip-version-check"]
+    if os.path.isdir(DRIVE_ROOT):
+        os.makedirs(PIP_CACHE_DIR, exist_ok=True)
+        os.environ["PIP_CACHE_DIR"] = PIP_CACHE_DIR
+        pip_cmd += ["--cache-dir", PIP_CACHE_DIR]
+        print(f"💾 Using persistent pip cache: {PIP_CACHE_DIR}")
     
-    print("✅ All packages installed!")
+    # Install everything in one pip run so the resolver only runs once
+    try:
+        print(f"Installing {len(packages)} packages: {', '.join(packages)}")
+        subprocess.check_call([*pip_cmd, *packages])
+        print("✅ All packages installed!")
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Failed to install packages: {e}")
 
 def setup_environment():
     """Set up environment variables"""
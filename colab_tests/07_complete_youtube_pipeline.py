@@ -174,15 +174,22 @@ class ServerManager:
             pass
         
         # Start server
-        self.process = subprocess.Popen([
-            'uvicorn', 'src.main:app', 
-            '--host', '0.0.0.0', 
-            '--port', '8000',
-            '--workers', '1'
-        ], 
-        cwd='/content/drive/MyDrive/my_project/backend',
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE)
+        # uvicorn's own output (import errors, port in use, tracebacks raised before
+        # main.py configures logging) is appended to logs/uvicorn.out; app logs also
+        # go to logs/backend.log. An unread PIPE would fill up and block the server.
+        backend_dir = '/content/drive/MyDrive/my_project/backend'
+        self.server_log_path = os.path.join(backend_dir, 'logs', 'uvicorn.out')
+        os.makedirs(os.path.dirname(self.server_log_path), exist_ok=True)
+        with open(self.server_log_path, 'a') as server_log:
+            self.process = subprocess.Popen([
+                'uvicorn', 'src.main:app', 
+                '--host', '0.0.0.0', 
+                '--port', '8000',
+                '--workers', '1'
+            ], 
+            cwd=backend_dir,
+            stdout=server_log,
+            stderr=subprocess.STDOUT)
         
         # Wait for server to be ready (longer wait)
         for i in range(40):
@@ -194,6 +201,7 @@ class ServerManager:
                 print(f"⏳ Waiting for server... ({i+1}/40)")
         
         print("❌ Server failed to start within 2 minutes")
+        print(f"   See {self.server_log_path} for uvicorn's output")
         return False
     
     def ensure_server_running(self):